@@ -0,0 +1,301 @@
+import os
+import sys
+import json
+import configparser
+import argparse
+import operator
+
+import numpy as np
+
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from map_elites.file_utils import listdir_nohidden
+
+
+# ====================================================================================================
+# Aggregate the runs of an experiment into the CEC 2010 statistics of each function: best, worst and
+# median of the best solution of each run (with their number of violated constraints), c and v of the
+# median solution, mean, std and feasibility rate. Replaces aggregate_results.ipynb.
+#
+# Runs are read from {logdir}/{function}/{run} (the layout of run_campaign.py and of the ensemble mode)
+# or from {logdir}/{experiment}/{function}/{run}. Only the elites of the runs are read (dense runs are
+# memory-mapped), so the memory grows with the number of occupied cells and not with the size of the grid.
+# The statistics are computed with array operations over the elites and the functions are aggregated in
+# parallel. Each experiment gets a LaTeX table (aggregate.tex) and a machine-readable file (aggregate.json)
+# in its directory.
+#
+# As in CEC 2010, c counts the violated constraints of the median solution whose violation is greater than
+# 1, greater than 0.01 and greater than 0.0001, in this order, computed from the constraint values of the
+# solution. The c of aggregate_results.ipynb counted them by the bin of the cell instead, in the opposite
+# order (bins of > 0.0001, > 0.01 and > 1), so the two tables cannot be compared column by column.
+# v is the sum of the constraint violations of the median solution divided by the number of constraints.
+#
+# The violated constraints of the elites are read from the bins of their cells, with the bins of the
+# config.ini of each run: the bins must have an edge at 0 for the inequality constraints and at 0.0001
+# for the equality constraints, so that each bin holds either satisfied or violated constraints.
+# ====================================================================================================
+
+AGGREGATE_FILE = 'aggregate.json'
+TABLE_FILE = 'aggregate.tex'
+# an equality constraint h is satisfied when |h| <= 0.0001, an inequality constraint when its violation is 0
+EQUALITY_TOLERANCE = 0.0001
+# thresholds of the violations counted by c, from the largest
+VIOLATION_THRESHOLDS = (1., 0.01, 0.0001)
+
+
+def run_dirs(function_dir):
+    """
+    Log directories of the runs of a function
+    :param function_dir: Path of the directory of the function
+    :return: list of paths, sorted by run number
+    """
+    runs = [function_dir / r for r in listdir_nohidden(function_dir)
+            if (function_dir / r / 'performances.npy').is_file() or (function_dir / r / 'elites.npz').is_file()]
+    return sorted(runs, key=lambda r: (not r.name.isdigit(), int(r.name) if r.name.isdigit() else 0, r.name))
+
+
+def open_run(run_dir):
+    """
+    Open the map of elites of a run without loading the dense files in memory
+    :param run_dir: Path of the log directory of the run
+    :return: Archive instance, memory-mapped for dense archives
+    """
+    from map_elites.archive import load_archive
+    return load_archive(run_dir, mmap_mode='r')
+
+
+def first_violated_bins(run_dir, F, shape):
+    """
+    First bin of each feature dimension whose cells violate the constraint, from the bins
+    in the config.ini of the run (or of its parent directory for the runs of an ensemble)
+    :param run_dir: Path of the log directory of the run
+    :param F: ConstrainedFunction instance
+    :param shape: Number of bins of each feature dimension of the map of elites of the run
+    :return: array of shape (n_constraints,)
+    """
+    from map_elites.feature_dimension import parse_bins
+
+    config_path = next((p for p in (run_dir / 'config.ini', run_dir.parent / 'config.ini') if p.is_file()), None)
+    if config_path is None:
+        raise ValueError(f"Aggregate: no config.ini for run {run_dir}")
+    config = configparser.ConfigParser()
+    config.read(config_path)
+    section = config['opt_function']
+
+    first = list()
+    for j, c in enumerate(F.constraints().values()):
+        bins = np.array(parse_bins(section.get(f"bin_{c['name']}", fallback=section.get('bin_all'))))
+        if len(bins) - 1 != shape[j]:
+            raise ValueError(f"Aggregate: the bins in {config_path} do not match the map of elites of run {run_dir}")
+        threshold = EQUALITY_TOLERANCE if c['op'] == operator.eq else 0.
+        edge = np.flatnonzero(bins == threshold)
+        if len(edge) == 0:
+            raise ValueError(f"Aggregate: the bins of constraint {c['name']} of run {run_dir} have no edge at "
+                             f"{threshold}, their cells mix satisfied and violated constraints")
+        first.append(edge[0])
+    return np.array(first)
+
+
+def violated_constraints(shape, first_violated_bin, cells):
+    """
+    Violated constraints of some cells of the grid, from the bins of their coordinates
+    :param shape: Number of bins of each feature dimension, one per constraint
+    :param first_violated_bin: array of shape (n_constraints,), returned by `first_violated_bins()`
+    :param cells: array of shape (N,) of flat indices
+    :return: boolean array of shape (n_constraints, N)
+    """
+    coordinates = np.array(np.unravel_index(cells, shape)).reshape(len(shape), -1)
+    return coordinates >= first_violated_bin[:, None]
+
+
+def violations(F, X, equality):
+    """
+    Amount of violation of every constraint, 0 for the satisfied constraints
+    :param F: ConstrainedFunction instance
+    :param X: array of shape (N, D) of genotypes
+    :param equality: boolean array of shape (n_constraints,), True for the equality constraints
+    :return: array of shape (N, n_constraints)
+    """
+    values, targets = F.constraints_batch(X), F.targets_batch(X)
+    error = np.abs(values - targets)
+    return np.where(equality, np.where(error > EQUALITY_TOLERANCE, error, 0.), np.maximum(values - targets, 0.))
+
+
+def aggregate_function(function_dir):
+    """
+    CEC 2010 statistics of the runs of a function.
+    The solution of a run is its best feasible elite or, if the run has no feasible elite,
+    the elite with the lowest mean violation of its violated constraints.
+    Runs are ranked as in CEC 2010: feasible runs first, by objective value, then infeasible runs
+    by number of violated constraints, mean violation and objective value.
+    :param function_dir: Path of the directory of the function, named after its class in functions.py
+    :return: dict of statistics
+    """
+    import functions
+
+    function_dir = Path(function_dir)
+    runs = run_dirs(function_dir)
+    if not runs:
+        raise ValueError(f"Aggregate: no runs in {function_dir}")
+    archives = [open_run(r) for r in runs]
+    dimensions = archives[0].dimensions
+
+    F = getattr(functions, function_dir.name)(dimensions=dimensions)
+    equality = np.array([c['op'] == operator.eq for c in F.constraints().values()])
+    for r, archive in zip(runs, archives):
+        if len(equality) != len(archive.shape):
+            raise ValueError(f"Aggregate: {r} has {len(archive.shape)} feature dimensions, "
+                             f"{F.__class__.__name__} has {len(equality)} constraints")
+
+    cells = np.empty(len(runs), dtype=np.intp)
+    n_violated = np.empty(len(runs), dtype=int)
+    best_perfs = np.empty(len(runs))
+    feasible_runs = np.zeros(len(runs), dtype=bool)
+    run_violations = np.zeros(len(runs))
+    for r, archive in enumerate(archives):
+        # sorted, so that ties go to the first cell of the grid
+        filled = np.sort(archive.filled)
+        if len(filled) == 0:
+            raise ValueError(f"Aggregate: run {runs[r]} has an empty map of elites")
+        perfs = archive.performances_at(filled)
+        violated = violated_constraints(archive.shape, first_violated_bins(runs[r], F, archive.shape), filled)
+        feasible = ~violated.any(axis=0)
+        if feasible.any():
+            # best feasible elite
+            i = np.flatnonzero(feasible)[np.argmin(perfs[feasible])]
+            feasible_runs[r] = True
+        else:
+            # no feasible elites: elite with the lowest mean violation
+            mask = violated.T
+            v = np.sum(violations(F, archive.solutions_at(filled), equality) * mask, axis=1) / np.sum(mask, axis=1)
+            i = np.argmin(v)
+            run_violations[r] = v[i]
+        cells[r] = filled[i]
+        n_violated[r] = np.sum(violated[:, i])
+        best_perfs[r] = perfs[i]
+
+    # feasible runs have no violated constraints and a mean violation of 0, so they come first
+    order = np.lexsort((best_perfs, run_violations, n_violated))
+    best, worst = order[0], order[-1]
+    # nearest-rank median, as np.percentile(..., 50, method='nearest')
+    median = order[int(np.round(0.5 * (len(runs) - 1)))]
+
+    x_median = archives[median].solutions_at(cells[median:median + 1])
+    v_median = violations(F, x_median, equality)[0]
+    bounds = (np.inf,) + VIOLATION_THRESHOLDS
+    c = [int(np.sum((v_median > low) & (v_median <= high))) for high, low in zip(bounds, bounds[1:])]
+
+    def _coordinates(r):
+        return [int(i) for i in np.unravel_index(cells[r], archives[r].shape)]
+
+    return {
+        'function': function_dir.name,
+        'runs': len(runs),
+        'best_perf': float(best_perfs[best]),
+        'best_consts': int(n_violated[best]),
+        'best_cell': _coordinates(best),
+        'worst_perf': float(best_perfs[worst]),
+        'worst_consts': int(n_violated[worst]),
+        'worst_cell': _coordinates(worst),
+        'median_perf': float(best_perfs[median]),
+        'median_consts': int(n_violated[median]),
+        'median_cell': _coordinates(median),
+        'c': c,
+        'v': float(np.sum(v_median) / len(equality)),
+        'mean': float(np.mean(best_perfs)),
+        'std': float(np.std(best_perfs)),
+        'f_rate': float(np.mean(feasible_runs)),
+        'run_perfs': best_perfs.tolist(),
+        'run_feasible': feasible_runs.tolist()
+    }
+
+
+def number_to_str(n):
+    if n == 0:
+        return "0"
+    return "{0:.3e}".format(n)
+
+
+def latex_table(results):
+    """
+    LaTeX rows of the statistics, one function per row
+    :param results: list of dicts returned by `aggregate_function()`
+    """
+    lines = ["Function &Best &Worst &Median &$c$ &$\\bar{v}$ &Mean &Std &FRate\\\\",
+             "\\midrule"]
+    for v in results:
+        lines.append("{0} &{1}({2}) &{3}({4}) &{5}({6}) &({7}) &{8} &{9} &{10} &{11:.2f}\\\\".format(
+            v['function'],
+            number_to_str(v['best_perf']), v['best_consts'],
+            number_to_str(v['worst_perf']), v['worst_consts'],
+            number_to_str(v['median_perf']), v['median_consts'],
+            ", ".join(str(i) for i in v['c']),
+            number_to_str(v['v']),
+            number_to_str(v['mean']),
+            number_to_str(v['std']),
+            v['f_rate']))
+    return "\n".join(lines) + "\n"
+
+
+def experiment_dirs(log_dir):
+    """
+    Directories of the experiments in a log directory: the log directory itself if it contains
+    function directories, otherwise its sub-directories that do
+    """
+    import functions
+
+    def _functions(path):
+        return [path / c for c in listdir_nohidden(path) if (path / c).is_dir() and hasattr(functions, c)]
+
+    log_dir = Path(log_dir)
+    if _functions(log_dir):
+        return {log_dir: _functions(log_dir)}
+    return {log_dir / e: _functions(log_dir / e) for e in listdir_nohidden(log_dir)
+            if (log_dir / e).is_dir() and _functions(log_dir / e)}
+
+
+def aggregate(log_dir, workers=None):
+    """
+    Aggregate all the experiments of a log directory, writing their LaTeX table and JSON results
+    :param log_dir: Path of the log directory
+    :param workers: Number of worker processes. None or 0 to use all the available cores
+    :return: dict experiment directory -> list of the statistics of its functions
+    """
+    experiments = experiment_dirs(log_dir)
+    function_dirs = [f for fs in experiments.values() for f in fs]
+    workers = min(workers or os.cpu_count() or 1, max(len(function_dirs), 1))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            stats = list(executor.map(aggregate_function, function_dirs))
+    else:
+        stats = [aggregate_function(f) for f in function_dirs]
+
+    results = dict()
+    it = iter(stats)
+    for experiment, fs in experiments.items():
+        results[experiment] = [next(it) for _ in fs]
+        with open(experiment / AGGREGATE_FILE, 'w') as f:
+            json.dump(results[experiment], f, indent=2)
+        with open(experiment / TABLE_FILE, 'w') as f:
+            f.write(latex_table(results[experiment]))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Aggregate the runs of MAP-Elites experiments')
+    parser.add_argument('logdir', type=str, help='Log directory of an experiment or of a set of experiments')
+    parser.add_argument('--workers', type=int, default=0, help='Number of worker processes, 0 to use all the cores')
+
+    args = parser.parse_args()
+
+    results = aggregate(args.logdir, workers=args.workers)
+    if not results:
+        print(f"No experiments found in {args.logdir}")
+        sys.exit(1)
+    for experiment, stats in results.items():
+        print(f"{experiment}:")
+        print(latex_table(stats))
+
+
+if __name__ == "__main__":
+    main()
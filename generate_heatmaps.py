@@ -1,47 +1,126 @@
 import os
-
-import numpy as np
+import json
+import argparse
 
 from tqdm import tqdm
 from pathlib import Path
-from map_elites.plot_utils import plot_heatmap
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from map_elites.deferred_plotting import HEATMAP_JOB_FILE, HEATMAP_CACHE_FILE, read_heatmap_options, load_performances, \
+    render_key, render_heatmap
+
 
-def listdir_nohidden(path):
-    for f in os.listdir(path):
-        if not f.startswith('.'):
-            yield f
-            
-logdir_path = "logs/complete_logs/"
+# ====================================================================================================
+# Regenerate the heatmaps of all the runs in a log directory, e.g. {logdir}/{experiment}/{function}/{run}.
+# Both dense (performances.npy) and sparse (elites.npz) maps of elites are rendered, on a pool of worker
+# processes. The hash of the map of elites of each run is cached in heatmap.json next to the figures, so runs
+# whose map and rendering options did not change since the last render are skipped. heatmap.json also keeps
+# the options of the heatmap, so later renders (e.g. with --force or --fast) use the same axes and title. The fast renderer
+# draws the map as an image with matplotlib only, without pandas/seaborn, and is meant for large grids and
+# quick previews of a campaign. Runs with a deferred heatmap (plotting mode `deferred`) are rendered with
+# the options of their job (axes, title, minimization and highlight of the best cell), with the same
+# renderer as the background and deferred plotting modes, so both give the same figure.
+# ====================================================================================================
 
-logdir = Path(logdir_path)
 ft_bins = ["-inf", "0", "0.0001", "0.01", "1", "inf"]
-steps = 6 * 18 * 25
-with tqdm(total=steps, desc="Heatmaps generated") as pbar:
-    # loop through experiments
-    for e in sorted(listdir_nohidden(logdir)):
-#         print(e)
-        # loop through functions
-        for c in sorted(listdir_nohidden(logdir / e)):
-#             print(f"\t{c}")
-            # loop through runs
-            for r in listdir_nohidden(logdir / e / c):
-                if r == "plots":
-                    continue
-                p = np.load(logdir / e / c / r / "performances.npy")
-
-                if len(p.shape) == 1:
-                    y_ax = ["-"]
-                    x_ax = ft_bins
-                else:
-                    x_ax = ft_bins
-                    y_ax = ft_bins
-
-                # remove previous plots
-                try:
-                    os.remove(logdir / e / c / r / "heatmap.png")
-                    os.remove(logdir / e / c / r / "heatmap.pdf")
-                except OSError:
-                    pass
-                # generate new heatmaps
-                plot_heatmap(p, x_ax, y_ax, savefig_path=(logdir / e / c / r), title=f"{c} function", interactive=False, plot_annotations=False)
-                pbar.update(1)
\ No newline at end of file
+
+
+def find_runs(log_dir):
+    """
+    Log directories of all the runs below a directory, i.e. the ones with a performances.npy or elites.npz file
+    :param log_dir: Root directory
+    :return: sorted list of paths
+    """
+    runs = list()
+    for root, dirs, files in os.walk(log_dir):
+        dirs[:] = [d for d in dirs if not d.startswith('.') and d != "plots"]
+        if 'performances.npy' in files or 'elites.npz' in files:
+            runs.append(Path(root))
+    return sorted(runs)
+
+
+def is_cached(run_dir, key):
+    """
+    True if the heatmaps of the run were rendered with the same key and are still there
+    """
+    try:
+        with open(run_dir / HEATMAP_CACHE_FILE) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return False
+    # the cache entry also holds the options of the heatmap
+    return {k: cached.get(k) for k in key} == key and all((run_dir / f"heatmap.{f}").is_file() for f in key['formats']) \
+        and not (run_dir / HEATMAP_JOB_FILE).is_file()
+
+
+def render(run_dir, fast=False, formats=('png', 'pdf'), force=False):
+    """
+    Render the heatmap of a run, unless it is cached
+    :param run_dir: Log directory of the run. Its parent is named after the function
+    :param fast: Use the raster renderer instead of seaborn
+    :param formats: File formats to save
+    :param force: Render even if the heatmap is cached
+    :return: True if the heatmap was rendered, False if it was skipped
+    """
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+
+    run_dir = Path(run_dir)
+    key = render_key(run_dir, fast, formats)
+    if not force and is_cached(run_dir, key):
+        return False
+
+    # options of a pending job, or else the ones of the last render
+    job = read_heatmap_options(run_dir)
+    p = None
+    if job is None:
+        p = load_performances(run_dir)
+        job = {'x_axis': list(ft_bins),
+               'y_axis': ["-"] if len(p.shape) == 1 else list(ft_bins),
+               'title': f"{run_dir.parent.name} function",
+               'minimization': True,
+               'highlight_best': True}
+
+    render_heatmap(run_dir, job, fast=fast, formats=formats, performances=p)
+    return True
+
+
+def generate_heatmaps(log_dir, workers=None, fast=False, formats=('png', 'pdf'), force=False):
+    """
+    Render the heatmaps of all the runs below a log directory on a process pool
+    :param log_dir: Root log directory
+    :param workers: Number of worker processes. None or 0 to use all the available cores
+    :return: number of heatmaps rendered and number of runs skipped
+    """
+    runs = find_runs(log_dir)
+    workers = min(workers or os.cpu_count() or 1, max(len(runs), 1))
+    rendered = 0
+    with tqdm(total=len(runs), desc="Heatmaps generated") as pbar:
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(render, r, fast, formats, force) for r in runs]
+                for future in as_completed(futures):
+                    rendered += future.result()
+                    pbar.update(1)
+        else:
+            for r in runs:
+                rendered += render(r, fast, formats, force)
+                pbar.update(1)
+    return rendered, len(runs) - rendered
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Regenerate the heatmaps of the runs in a log directory')
+    parser.add_argument('logdir', type=str, nargs='?', default="logs/complete_logs/", help='Root log directory')
+    parser.add_argument('--workers', type=int, default=0, help='Number of worker processes, 0 to use all the cores')
+    parser.add_argument('--fast', action='store_true', help='Raster renderer without pandas/seaborn')
+    parser.add_argument('--formats', type=str, nargs='+', default=['png', 'pdf'], help='File formats to save')
+    parser.add_argument('--force', action='store_true', help='Render also the runs with a cached heatmap')
+
+    args = parser.parse_args()
+
+    rendered, skipped = generate_heatmaps(args.logdir, workers=args.workers, fast=args.fast,
+                                          formats=args.formats, force=args.force)
+    print(f"{rendered} heatmaps rendered, {skipped} unchanged runs skipped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,755 @@
+import numpy as np
+
+from pathlib import Path
+from abc import ABC, abstractmethod
+
+
+class Archive(ABC):
+    """
+    Map of elites over an N-dimensional grid of cells.
+    Cells are addressed either by their tuple of coordinates in the feature space or by their
+    flat index (C order). Besides performances and solutions, the archive keeps the list of
+    the occupied flat indices, so that occupied cells can be counted and sampled in O(1).
+    Statistics of the elites (best elite, QD-score and best elite of each feasibility level)
+    are updated on every insertion, so they are O(1) to query.
+    Subclasses implement the storage of the elites.
+    """
+
+    def __init__(self, shape, dimensions, minimization=True):
+        """
+        :param shape: Number of bins of each feature dimension
+        :param dimensions: Number of dimensions of the solutions
+        :param minimization: True if solving a minimization problem. False if solving a maximization problem.
+        """
+        self.shape = tuple(int(s) for s in shape)
+        self.dimensions = dimensions
+        self.size = int(np.prod(self.shape))
+        self.minimization = minimization
+
+        # running statistics of the elites.
+        # The feasibility level of a cell is its number of coordinates in the first bin,
+        # i.e. the number of satisfied constraints. Each level keeps its best elite.
+        self._worst = np.inf if minimization else -np.inf
+        self._performance_sum = 0.
+        self._level_best_cells = np.full(len(self.shape) + 1, -1, dtype=np.intp)
+        self._level_best_perfs = np.full(len(self.shape) + 1, self._worst)
+
+    @property
+    @abstractmethod
+    def filled(self):
+        """
+        Flat indices of the occupied cells, in no particular order
+        """
+        pass
+
+    def __len__(self):
+        """
+        Number of occupied cells
+        """
+        return len(self.filled)
+
+    @property
+    @abstractmethod
+    def performances(self):
+        """
+        N-dimensional array of the performances of the elites. Empty cells are inf
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def solutions(self):
+        """
+        N-dimensional array of the elites genotypes. Empty cells are inf
+        """
+        pass
+
+    @abstractmethod
+    def performances_at(self, cells):
+        """
+        Performances of some cells
+        :param cells: array of shape (N,) of flat indices
+        :return: array of shape (N,) of performances, inf for empty cells
+        """
+        pass
+
+    @abstractmethod
+    def solutions_at(self, cells):
+        """
+        Copy of the elites of some cells
+        :param cells: array of shape (N,) of flat indices
+        :return: array of shape (N, D) of genotypes, inf for empty cells
+        """
+        pass
+
+    @abstractmethod
+    def is_occupied(self, cells):
+        """
+        :param cells: array of shape (N,) of flat indices
+        :return: boolean array of shape (N,)
+        """
+        pass
+
+    @abstractmethod
+    def _write(self, cells, perfs, X):
+        """
+        Write elites in cells, occupying the empty ones
+        :param cells: array of shape (N,) of distinct flat indices
+        :param perfs: array of shape (N,) of performances
+        :param X: array of shape (N, D) of genotypes
+        """
+        pass
+
+    @abstractmethod
+    def _clear(self, cell):
+        """
+        Empty an occupied cell
+        :param cell: flat index of the cell
+        """
+        pass
+
+    @abstractmethod
+    def save(self, path):
+        """
+        Save the archive to a directory
+        :param path: Path of the directory
+        """
+        pass
+
+    def cell(self, b):
+        """
+        Flat index of a cell
+        :param b: tuple of coordinates, or array of shape (N, number of feature dimensions)
+        :return: flat index, or array of shape (N,) of flat indices
+        """
+        b = np.asarray(b, dtype=np.intp)
+        if b.ndim == 1:
+            return int(np.ravel_multi_index(tuple(b), self.shape))
+        return np.ravel_multi_index(tuple(b.T), self.shape)
+
+    def coordinates(self, cell):
+        """
+        Tuple of coordinates of a flat cell index
+        """
+        return tuple(int(i) for i in np.unravel_index(cell, self.shape))
+
+    def levels(self, cells):
+        """
+        Feasibility level of some cells: their number of coordinates in the first bin
+        :param cells: array of shape (N,) of flat indices
+        :return: array of shape (N,) of levels
+        """
+        coordinates = np.unravel_index(np.asarray(cells, dtype=np.intp), self.shape)
+        return np.sum([c == 0 for c in coordinates], axis=0, dtype=np.intp)
+
+    def _is_better(self, a, b):
+        return a < b if self.minimization else a > b
+
+    @property
+    def best(self):
+        """
+        Best elite of the archive
+        :return: flat index of its cell and its performance, (None, None) if the archive is empty
+        """
+        level = self._level_best_perfs.argmin() if self.minimization else self._level_best_perfs.argmax()
+        return self.level_best(level)
+
+    def level_best(self, level):
+        """
+        Best elite among the cells of a feasibility level
+        :param level: number of satisfied constraints, between 0 and the number of feature dimensions
+        :return: flat index of its cell and its performance, (None, None) if the level has no elite
+        """
+        cell = int(self._level_best_cells[level])
+        if cell < 0:
+            return None, None
+        return cell, float(self._level_best_perfs[level])
+
+    def most_promising(self):
+        """
+        Best elite of the highest feasibility level holding at least one elite,
+        i.e. the best solution satisfying the highest number of constraints
+        :return: flat index of its cell, its performance and its level.
+            (None, None, None) if no elite satisfies at least one constraint
+        """
+        for level in reversed(range(1, len(self._level_best_cells))):
+            cell, perf = self.level_best(level)
+            if cell is not None:
+                return cell, perf, level
+        return None, None, None
+
+    def qd_score(self, offset=0.):
+        """
+        Quality-diversity score: sum over the elites of their improvement on `offset`
+        (offset - performance when minimizing, performance - offset when maximizing)
+        :param offset: Reference performance, e.g. the worst possible performance
+        """
+        if self.minimization:
+            return len(self) * offset - self._performance_sum
+        return self._performance_sum - len(self) * offset
+
+    def _store(self, cells, perfs, X):
+        """
+        Write elites in cells, occupying the empty ones, and update the statistics
+        :param cells: array of shape (N,) of distinct flat indices
+        :param perfs: array of shape (N,) of performances
+        :param X: array of shape (N, D) of genotypes
+        """
+        cells = np.asarray(cells, dtype=np.intp)
+        perfs = np.asarray(perfs, dtype=float)
+        previous = self.performances_at(cells[self.is_occupied(cells)])
+        self._write(cells, perfs, X)
+        self._performance_sum += np.sum(perfs) - np.sum(previous)
+
+        levels = self.levels(cells)
+        # a level whose best elite is overwritten by a worse one must be recomputed
+        overwritten = (cells == self._level_best_cells[levels]) & \
+            self._is_better(self._level_best_perfs[levels], perfs)
+        stale = np.unique(levels[overwritten])
+        for level in np.unique(levels):
+            in_level = np.flatnonzero(levels == level)
+            i = in_level[perfs[in_level].argmin() if self.minimization else perfs[in_level].argmax()]
+            if self._is_better(perfs[i], self._level_best_perfs[level]):
+                self._level_best_cells[level] = cells[i]
+                self._level_best_perfs[level] = perfs[i]
+        for level in stale:
+            self._update_level_best(level)
+
+    def remove(self, cell):
+        """
+        Empty a cell
+        :param cell: flat index of the cell
+        """
+        cells = np.array([cell], dtype=np.intp)
+        if not self.is_occupied(cells)[0]:
+            return
+        self._performance_sum -= self.performances_at(cells)[0]
+        self._clear(cell)
+        level = self.levels(cells)[0]
+        if self._level_best_cells[level] == cell:
+            self._update_level_best(level)
+
+    def _update_level_best(self, level):
+        """
+        Recompute the best elite of a feasibility level from the occupied cells
+        """
+        cells = self.filled[self.levels(self.filled) == level]
+        self._level_best_cells[level] = -1
+        self._level_best_perfs[level] = self._worst
+        if len(cells) > 0:
+            perfs = self.performances_at(cells)
+            i = perfs.argmin() if self.minimization else perfs.argmax()
+            self._level_best_cells[level] = cells[i]
+            self._level_best_perfs[level] = perfs[i]
+
+    def _accept(self, cells, perfs):
+        """
+        Element-wise check if new solutions should replace the current elites:
+        either the cell is empty or the new performance is better
+        """
+        current = self.performances_at(cells)
+        if self.minimization:
+            better = perfs < current
+        else:
+            better = perfs >= current
+        return better | (~self.is_occupied(cells) & np.isfinite(perfs))
+
+    def insert(self, cell, perf, x):
+        """
+        Place a solution in a cell if the cell is empty or the solution is better than the current elite
+        :param cell: flat index of the cell
+        :param perf: performance of the solution
+        :param x: genotype of the solution
+        :return: True if the solution was placed
+        """
+        cells = np.array([cell], dtype=np.intp)
+        perfs = np.array([perf], dtype=float)
+        if not self._accept(cells, perfs)[0]:
+            return False
+        self._store(cells, perfs, np.asarray(x, dtype=float).reshape(1, self.dimensions))
+        return True
+
+    def insert_batch(self, cells, perfs, X):
+        """
+        Place a batch of solutions. When several solutions land in the same cell
+        only the best one of them competes with the current elite (scatter-min).
+        :param cells: array of shape (N,) of flat indices
+        :param perfs: array of shape (N,) of performances
+        :param X: array of shape (N, D) of genotypes
+        :return: boolean array of shape (N,), True for the solutions that were placed
+        """
+        cells = np.asarray(cells, dtype=np.intp)
+        perfs = np.asarray(perfs, dtype=float)
+        # sort by cell and then by performance, so the best individual of each cell comes first
+        order = np.lexsort((perfs if self.minimization else -perfs, cells))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = cells[order[1:]] != cells[order[:-1]]
+        best = order[first]
+
+        best = best[self._accept(cells[best], perfs[best])]
+        self._store(cells[best], perfs[best], X[best])
+
+        placed = np.zeros(len(cells), dtype=bool)
+        placed[best] = True
+        return placed
+
+    def elites(self):
+        """
+        Copy of the elites, in the order of the occupied cells
+        :return: array of shape (N,) of flat indices, array of shape (N,) of performances
+            and array of shape (N, D) of genotypes
+        """
+        cells = self.filled.copy()
+        return cells, self.performances_at(cells), self.solutions_at(cells)
+
+    def restore(self, cells, perfs, X):
+        """
+        Fill an empty archive with the elites returned by `elites()`.
+        The order of the occupied cells is preserved, so sampling gives the same results
+        :param cells: array of shape (N,) of distinct flat indices
+        :param perfs: array of shape (N,) of performances
+        :param X: array of shape (N, D) of genotypes
+        """
+        if len(self) > 0:
+            raise ValueError("Cannot restore elites into a non-empty map of elites")
+        self._store(cells, perfs, X)
+
+    def sample(self, k, replace=True, rng=None):
+        """
+        Sample occupied cells uniformly at random
+        :param k: number of cells
+        :param replace: False to sample k distinct cells
+        :param rng: Random generator. Defaults to a generator seeded from the OS entropy
+        :return: array of shape (k,) of flat indices
+        """
+        n = len(self)
+        if n == 0 or (not replace and k > n):
+            raise ValueError(f"Cannot sample {k} elites from a map of elites with {n} occupied cells")
+        rng = rng if rng is not None else np.random.default_rng()
+        if replace:
+            return self.filled[rng.integers(0, n, k)]
+        return self.filled[rng.choice(n, k, replace=False)]
+
+
+class DenseArchive(Archive):
+    """
+    Archive storing performances and solutions in dense N-dimensional arrays,
+    plus an occupancy bitmap and the dense list of occupied cells with swap-remove.
+    Memory grows with the number of cells of the grid.
+    """
+
+    def __init__(self, shape, dimensions, minimization=True):
+        super().__init__(shape, dimensions, minimization=minimization)
+
+        # Initialize data structures to store solutions and fitness values
+        self._performances, self._solutions = self._allocate()
+        self._allocate_occupancy()
+
+    def _allocate_occupancy(self):
+        """
+        Create the occupancy bitmap, the dense list of occupied cells and the position of each cell in that list
+        """
+        self.occupied = np.zeros(self.size, dtype=bool)
+        self._filled = np.empty(self.size, dtype=np.intp)
+        self._position = np.full(self.size, -1, dtype=np.intp)
+        self._n_filled = 0
+
+    def _allocate(self):
+        """
+        Create the arrays of performances and solutions, with all the cells empty
+        :return: arrays of shape `shape` and `shape` + (dimensions,)
+        """
+        return np.full(self.shape, np.inf), np.full(self.shape + (self.dimensions,), np.inf)
+
+    @property
+    def performances(self):
+        return self._performances
+
+    @property
+    def solutions(self):
+        return self._solutions
+
+    @property
+    def flat_performances(self):
+        """
+        Performances as a 1D view over the flat cell indices
+        """
+        return self._performances.reshape(self.size)
+
+    @property
+    def flat_solutions(self):
+        """
+        Solutions as a 2D view of shape (cells, dimensions)
+        """
+        return self._solutions.reshape(self.size, self.dimensions)
+
+    @property
+    def filled(self):
+        return self._filled[:self._n_filled]
+
+    def __len__(self):
+        return self._n_filled
+
+    def performances_at(self, cells):
+        return self.flat_performances[cells]
+
+    def solutions_at(self, cells):
+        return self.flat_solutions[cells]
+
+    def is_occupied(self, cells):
+        return self.occupied[cells]
+
+    def _write(self, cells, perfs, X):
+        self.flat_performances[cells] = perfs
+        self.flat_solutions[cells] = X
+        self._occupy(cells)
+
+    def _occupy(self, cells):
+        """
+        Append the newly occupied cells to the list of occupied cells
+        """
+        new = cells[~self.occupied[cells]]
+        self.occupied[new] = True
+        self._position[new] = np.arange(self._n_filled, self._n_filled + len(new))
+        self._filled[self._n_filled:self._n_filled + len(new)] = new
+        self._n_filled += len(new)
+
+    def _clear(self, cell):
+        """
+        Empty a cell, swapping the last occupied cell in its place in the list of occupied cells
+        :param cell: flat index of the cell
+        """
+        pos = self._position[cell]
+        last = self._filled[self._n_filled - 1]
+        self._filled[pos] = last
+        self._position[last] = pos
+        self._position[cell] = -1
+        self._n_filled -= 1
+        self.occupied[cell] = False
+        self.flat_performances[cell] = np.inf
+        self.flat_solutions[cell] = np.inf
+
+    def save(self, path):
+        """
+        Save performances and solutions as `performances.npy` and `solutions.npy`
+        :param path: Path of the directory
+        """
+        np.save(path / 'performances', self._performances)
+        np.save(path / 'solutions', self._solutions)
+
+
+class StackedArchive(DenseArchive):
+    """
+    Dense archive storing its elites in existing arrays, e.g. the slices of stacked arrays
+    holding the maps of elites of several runs. The arrays must be filled with inf
+    """
+
+    def __init__(self, performances, solutions, minimization=True):
+        """
+        :param performances: array of shape `shape` of performances
+        :param solutions: array of shape `shape` + (dimensions,) of genotypes
+        """
+        self._arrays = performances, solutions
+        super().__init__(performances.shape, solutions.shape[-1], minimization=minimization)
+
+    def _allocate(self):
+        return self._arrays
+
+
+class MemmapArchive(DenseArchive):
+    """
+    Dense archive whose performances and solutions are memory-mapped `performances.npy`
+    and `solutions.npy` files in a directory, usually the log directory of the run.
+    The operating system pages the grid in and out, so the grid is not limited by the RAM,
+    and analysis tools can open the files of a running or finished run without loading them
+    (`np.load(..., mmap_mode='r')`). The bookkeeping of the occupied cells is sparse, as in
+    `SparseArchive`, so the RAM grows with the number of occupied cells only.
+    """
+
+    # number of cells scanned at once when opening the files of an existing archive
+    SCAN_CHUNK = 1 << 22
+
+    def __init__(self, shape, dimensions, minimization=True, path='.', mode='w+'):
+        """
+        :param path: Directory of the memory-mapped files
+        :param mode: `w+` to create new files, `r+` to open the files of an existing archive
+            or `r` to open them read-only
+        """
+        if mode not in ['w+', 'r+', 'r']:
+            raise ValueError(f"The memory-mapped archive mode must be one of ['w+', 'r+', 'r'], got {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        super().__init__(shape, dimensions, minimization=minimization)
+        if mode != 'w+':
+            # rebuild the occupied cells and the statistics from the existing files, one chunk at a time
+            for start in range(0, self.size, self.SCAN_CHUNK):
+                perfs = self.flat_performances[start:start + self.SCAN_CHUNK]
+                cells = start + np.flatnonzero(np.isfinite(perfs))
+                self._occupy(cells)
+                self._performance_sum += np.sum(self.flat_performances[cells])
+            for level in range(len(self.shape) + 1):
+                self._update_level_best(level)
+
+    def _allocate_occupancy(self, capacity=1024):
+        """
+        Create the list of occupied cells, grown on demand, and a hash map from each occupied cell
+        to its position in that list
+        :param capacity: Initial length of the list, doubled every time it is full
+        """
+        self._filled = np.empty(capacity, dtype=np.intp)
+        self._position = dict()
+        self._n_filled = 0
+
+    def is_occupied(self, cells):
+        return np.array([c in self._position for c in np.asarray(cells).tolist()], dtype=bool)
+
+    def _occupy(self, cells):
+        new = [c for c in np.asarray(cells).tolist() if c not in self._position]
+        n = self._n_filled + len(new)
+        if n > len(self._filled):
+            capacity = len(self._filled)
+            while capacity < n:
+                capacity *= 2
+            self._filled = np.resize(self._filled, capacity)
+        self._position.update(zip(new, range(self._n_filled, n)))
+        self._filled[self._n_filled:n] = new
+        self._n_filled = n
+
+    def _clear(self, cell):
+        pos = self._position.pop(cell)
+        last = int(self._filled[self._n_filled - 1])
+        if last != cell:
+            self._filled[pos] = last
+            self._position[last] = pos
+        self._n_filled -= 1
+        self.flat_performances[cell] = np.inf
+        self.flat_solutions[cell] = np.inf
+
+    def _allocate(self):
+        if self.mode == 'w+':
+            performances = np.lib.format.open_memmap(self.path / 'performances.npy', mode='w+',
+                                                     dtype=float, shape=self.shape)
+            solutions = np.lib.format.open_memmap(self.path / 'solutions.npy', mode='w+',
+                                                  dtype=float, shape=self.shape + (self.dimensions,))
+            performances[...] = np.inf
+            solutions[...] = np.inf
+            return performances, solutions
+        performances = np.load(self.path / 'performances.npy', mmap_mode=self.mode)
+        solutions = np.load(self.path / 'solutions.npy', mmap_mode=self.mode)
+        if performances.shape != self.shape or solutions.shape != self.shape + (self.dimensions,):
+            raise ValueError(f"The memory-mapped files in {self.path} do not match the archive shape {self.shape}")
+        return performances, solutions
+
+    def flush(self):
+        """
+        Write the changes of the memory-mapped files to disk
+        """
+        if self.mode != 'r':
+            self._performances.flush()
+            self._solutions.flush()
+
+    def save(self, path):
+        """
+        Flush the memory-mapped files. Saving to another directory writes a copy of them
+        :param path: Path of the directory
+        """
+        self.flush()
+        if Path(path).resolve() != self.path.resolve():
+            super().save(path)
+
+
+class SparseArchive(Archive):
+    """
+    Archive storing only the occupied cells, in compact arrays indexed through
+    a hash map from flat cell index to slot. Memory grows with the number of occupied
+    cells, not with the number of cells of the grid, so it suits high-dimensional feature grids.
+    The dense `performances` and `solutions` arrays are materialized on request, up to `MAX_DENSE_ELEMENTS`
+    elements: use `elites()` on larger grids.
+    """
+
+    # largest dense array materialized by `performances` and `solutions`, 1 GiB of floats
+    MAX_DENSE_ELEMENTS = 1 << 27
+
+    def __init__(self, shape, dimensions, minimization=True, capacity=1024):
+        """
+        :param capacity: Initial number of slots, doubled every time the archive is full
+        """
+        super().__init__(shape, dimensions, minimization=minimization)
+        self._slots = dict()
+        self._cells = np.empty(capacity, dtype=np.intp)
+        self._perfs = np.empty(capacity)
+        self._sols = np.empty((capacity, dimensions))
+        self._n_filled = 0
+
+    @property
+    def filled(self):
+        return self._cells[:self._n_filled]
+
+    def __len__(self):
+        return self._n_filled
+
+    def can_densify(self, elements):
+        """
+        Check if a dense array over the grid is small enough to be materialized
+        :param elements: Number of elements of the array
+        """
+        return elements <= self.MAX_DENSE_ELEMENTS
+
+    def _check_densify(self, elements):
+        if not self.can_densify(elements):
+            raise ValueError(f"The sparse map of elites has {self.size} cells, too many to materialize a dense array "
+                             f"of {elements} elements (limit {self.MAX_DENSE_ELEMENTS}), use its elites instead")
+
+    @property
+    def performances(self):
+        self._check_densify(self.size)
+        performances = np.full(self.size, np.inf)
+        performances[self.filled] = self._perfs[:self._n_filled]
+        return performances.reshape(self.shape)
+
+    @property
+    def solutions(self):
+        self._check_densify(self.size * self.dimensions)
+        solutions = np.full((self.size, self.dimensions), np.inf)
+        solutions[self.filled] = self._sols[:self._n_filled]
+        return solutions.reshape(self.shape + (self.dimensions,))
+
+    def _get_slots(self, cells):
+        """
+        Slot of each cell, -1 for empty cells
+        """
+        return np.array([self._slots.get(c, -1) for c in cells.tolist()], dtype=np.intp)
+
+    def performances_at(self, cells):
+        slots = self._get_slots(cells)
+        return np.where(slots >= 0, self._perfs[slots], np.inf)
+
+    def solutions_at(self, cells):
+        slots = self._get_slots(cells)
+        return np.where((slots >= 0)[:, np.newaxis], self._sols[slots], np.inf)
+
+    def is_occupied(self, cells):
+        return self._get_slots(cells) >= 0
+
+    def _grow(self, n):
+        """
+        Make room for at least n occupied cells
+        """
+        capacity = len(self._cells)
+        if n <= capacity:
+            return
+        while capacity < n:
+            capacity *= 2
+        self._cells = np.resize(self._cells, capacity)
+        self._perfs = np.resize(self._perfs, capacity)
+        self._sols = np.resize(self._sols, (capacity, self.dimensions))
+
+    def _write(self, cells, perfs, X):
+        slots = self._get_slots(cells)
+        new = slots < 0
+        n_new = int(np.sum(new))
+        self._grow(self._n_filled + n_new)
+        slots[new] = np.arange(self._n_filled, self._n_filled + n_new)
+        self._slots.update(zip(cells[new].tolist(), slots[new].tolist()))
+        self._cells[slots] = cells
+        self._perfs[slots] = perfs
+        self._sols[slots] = X
+        self._n_filled += n_new
+
+    def _clear(self, cell):
+        """
+        Empty a cell, moving the last occupied slot in its place
+        :param cell: flat index of the cell
+        """
+        slot = self._slots.pop(cell)
+        last = self._n_filled - 1
+        if slot != last:
+            self._cells[slot] = self._cells[last]
+            self._perfs[slot] = self._perfs[last]
+            self._sols[slot] = self._sols[last]
+            self._slots[int(self._cells[slot])] = slot
+        self._n_filled -= 1
+
+    def save(self, path):
+        """
+        Save the occupied cells only, as `elites.npz` with the grid shape,
+        the flat cell indices, the performances and the solutions
+        :param path: Path of the directory
+        """
+        np.savez(path / 'elites',
+                 shape=np.array(self.shape),
+                 cells=self.filled,
+                 performances=self._perfs[:self._n_filled],
+                 solutions=self._sols[:self._n_filled])
+
+
+def feasibility_levels(shape):
+    """
+    Feasibility level of every cell of a grid: its number of coordinates in the first bin
+    :param shape: Number of bins of each feature dimension
+    :return: array of the given shape of levels
+    """
+    levels = np.zeros(shape, dtype=np.intp)
+    for axis, n in enumerate(shape):
+        first_bin = np.zeros(n, dtype=np.intp)
+        first_bin[0] = 1
+        # broadcast the first bin of this axis over all the other axes
+        levels += first_bin.reshape((n,) + (1,) * (len(shape) - axis - 1))
+    return levels
+
+
+def most_promising_solution(performances, minimization=True):
+    """
+    Best elite satisfying the highest number of constraints, from a dense array of performances.
+    Works on the performances saved in a log directory, with one masked reduction per level.
+    :param performances: N-dimensional array of performances, empty cells are inf
+    :param minimization: True if solving a minimization problem. False if solving a maximization problem.
+    :return: flat index of the cell of the elite, its performance and its level.
+        (None, None, None) if no elite satisfies at least one constraint
+    """
+    performances = np.asarray(performances)
+    levels = feasibility_levels(performances.shape).reshape(-1)
+    filled = np.isfinite(performances).reshape(-1)
+    for level in reversed(range(1, performances.ndim + 1)):
+        cells = np.flatnonzero(filled & (levels == level))
+        if len(cells) > 0:
+            perfs = performances.reshape(-1)[cells]
+            i = perfs.argmin() if minimization else perfs.argmax()
+            return int(cells[i]), float(perfs[i]), level
+    return None, None, None
+
+
+ARCHIVES = {
+    'dense': DenseArchive,
+    'memmap': MemmapArchive,
+    'sparse': SparseArchive
+}
+
+
+def load_archive(path, minimization=True, mmap_mode=None):
+    """
+    Load an archive saved in a log directory, either dense or sparse
+    :param path: Path of the log directory
+    :param minimization: True if the run solved a minimization problem
+    :param mmap_mode: `r` or `r+` to open the dense files as a MemmapArchive instead of loading them in memory
+    :return: Archive instance
+    """
+    path = Path(path)
+    if (path / 'elites.npz').is_file():
+        data = np.load(path / 'elites.npz')
+        archive = SparseArchive(data['shape'], data['solutions'].shape[1], minimization=minimization,
+                                capacity=max(len(data['cells']), 1))
+        archive.restore(data['cells'], data['performances'], data['solutions'])
+        return archive
+    if mmap_mode is not None:
+        # only the headers are read to get the shape of the archive
+        performances = np.load(path / 'performances.npy', mmap_mode='r')
+        solutions = np.load(path / 'solutions.npy', mmap_mode='r')
+        return MemmapArchive(performances.shape, solutions.shape[-1], minimization=minimization,
+                             path=path, mode=mmap_mode)
+    performances = np.load(path / 'performances.npy')
+    solutions = np.load(path / 'solutions.npy')
+    archive = DenseArchive(performances.shape, solutions.shape[-1], minimization=minimization)
+    cells = np.flatnonzero(~np.isinf(performances))
+    archive.restore(cells, performances.reshape(-1)[cells], solutions.reshape(archive.size, -1)[cells])
+    return archive
@@ -0,0 +1,114 @@
+import os
+import time
+import pickle
+
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+
+CHECKPOINT_FILE = 'checkpoint.pkl'
+
+
+def write_checkpoint(path, state):
+    """
+    Atomically write a checkpoint: the state is written to a temporary file
+    in the same directory and then moved in place, so a killed run never leaves a partial checkpoint
+    :param path: Path of the checkpoint file
+    :param state: Picklable checkpoint state
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path):
+    """
+    Load a checkpoint
+    :param path: Path of the checkpoint file, or of the log directory containing it
+    :return: The checkpoint state
+    """
+    path = Path(path)
+    if path.is_dir():
+        path = path / CHECKPOINT_FILE
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+class Checkpointer:
+    """
+    Periodically writes checkpoints every `every` evaluations and/or every `seconds` seconds.
+    Checkpoints are written by a background thread: while a checkpoint is being written
+    no new checkpoint is due, so the main loop never waits for the disk.
+    """
+
+    def __init__(self, path, every=0, seconds=0):
+        """
+        :param path: Path of the checkpoint file
+        :param every: Number of evaluations between two checkpoints. 0 to disable
+        :param seconds: Number of seconds between two checkpoints. 0 to disable
+        """
+        self.path = Path(path)
+        self.every = every
+        self.seconds = seconds
+        self.last_evaluations = 0
+        self._last_time = time.monotonic()
+        self._executor = None
+        self._pending = None
+
+    @property
+    def enabled(self):
+        return self.every > 0 or self.seconds > 0
+
+    @property
+    def busy(self):
+        """
+        True while the previous checkpoint is being written
+        """
+        return self._pending is not None and not self._pending.done()
+
+    def due(self, evaluations):
+        """
+        Check if a checkpoint has to be written
+        :param evaluations: Number of evaluations done so far
+        """
+        if not self.enabled or self.busy:
+            return False
+        return (self.every > 0 and evaluations - self.last_evaluations >= self.every) or \
+            (self.seconds > 0 and time.monotonic() - self._last_time >= self.seconds)
+
+    def save(self, state, evaluations, wait=False):
+        """
+        Write a checkpoint in the background
+        :param state: Picklable checkpoint state. It must not be modified afterwards
+        :param evaluations: Number of evaluations done so far
+        :param wait: Block until the checkpoint is written
+        """
+        self._check_pending()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = self._executor.submit(write_checkpoint, self.path, state)
+        self.last_evaluations = evaluations
+        self._last_time = time.monotonic()
+        if wait:
+            self._check_pending()
+
+    def _check_pending(self):
+        """
+        Wait for the previous checkpoint and raise its error, if any
+        """
+        if self._pending is not None:
+            self._pending.result()
+            self._pending = None
+
+    def close(self):
+        """
+        Wait for the last checkpoint to be written and stop the background thread
+        """
+        self._check_pending()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
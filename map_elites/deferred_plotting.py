@@ -0,0 +1,191 @@
+import os
+import sys
+import json
+import hashlib
+import subprocess
+
+import numpy as np
+
+from pathlib import Path
+
+
+# options of the heatmap of a run whose rendering was deferred, written in its log directory
+HEATMAP_JOB_FILE = 'heatmap_job.json'
+# cache key and options of the rendered heatmap of a run, written next to the figures
+HEATMAP_CACHE_FILE = 'heatmap.json'
+
+
+def write_heatmap_job(log_dir, x_axis, y_axis, title, minimization=True, highlight_best=True):
+    """
+    Save the options of the heatmap of a run, to render it later with `render_heatmap_job()`
+    :param log_dir: Path of the log directory of the run, where the map of elites is saved
+    :param x_axis: Labels of the bins of the first feature dimension
+    :param y_axis: Labels of the bins of the second feature dimension
+    :param title: Title of the heatmap
+    """
+    job = {'x_axis': list(x_axis),
+           'y_axis': list(y_axis),
+           'title': title,
+           'minimization': minimization,
+           'highlight_best': highlight_best}
+    with open(Path(log_dir) / HEATMAP_JOB_FILE, 'w') as f:
+        json.dump(job, f, indent=2)
+
+
+def read_heatmap_job(log_dir):
+    """
+    Options of the deferred heatmap of a run
+    :return: dict of options, None if the run has no deferred heatmap
+    """
+    path = Path(log_dir) / HEATMAP_JOB_FILE
+    if not path.is_file():
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def read_heatmap_options(log_dir):
+    """
+    Options of the heatmap of a run: the ones of its pending job, or else the ones saved
+    in heatmap.json by its last render
+    :return: dict of options, None if the run has neither
+    """
+    job = read_heatmap_job(log_dir)
+    if job is not None:
+        return job
+    try:
+        with open(Path(log_dir) / HEATMAP_CACHE_FILE) as f:
+            return json.load(f).get('options')
+    except (OSError, ValueError):
+        return None
+
+
+def heatmap_job_kwargs(job):
+    """
+    Keyword arguments of `plot_heatmap()` and `plot_heatmap_raster()` for a heatmap job
+    :param job: dict of options returned by `read_heatmap_job()`
+    :return: dict of keyword arguments
+    """
+    return {'x_axis': list(job['x_axis']),
+            'y_axis': list(job['y_axis']),
+            'title': job['title'],
+            'minimization': job['minimization'],
+            'highlight_best': job['highlight_best']}
+
+
+def load_performances(log_dir, minimization=True):
+    """
+    Performances of the map of elites saved in the log directory of a run, dense or sparse
+    :param log_dir: Path of the log directory of the run
+    :param minimization: True if the run solved a minimization problem
+    :return: array of performances, memory-mapped for dense archives
+    """
+    log_dir = Path(log_dir)
+    if (log_dir / 'elites.npz').is_file():
+        from .archive import load_archive
+        return load_archive(log_dir, minimization=minimization).performances
+    return np.load(log_dir / 'performances.npy', mmap_mode='r')
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """
+    Hash of the content of a file, read in chunks
+    """
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def map_file(log_dir):
+    """
+    File of the map of elites of a run: elites.npz for sparse archives, performances.npy otherwise
+    """
+    return log_dir / 'elites.npz' if (log_dir / 'elites.npz').is_file() else log_dir / 'performances.npy'
+
+
+def render_key(log_dir, fast, formats):
+    """
+    Cache key of the heatmap of a run: hash of its map of elites and rendering options
+    """
+    return {'performances': file_hash(map_file(log_dir)),
+            'renderer': 'fast' if fast else 'seaborn',
+            'formats': list(formats)}
+
+
+def render_heatmap(log_dir, job, fast=False, formats=('png', 'pdf'), performances=None):
+    """
+    Render the heatmap of a run from its saved map of elites, replacing the previous figures.
+    Used by the background and deferred renderers and by generate_heatmaps.py,
+    so that a run gets the same figure whichever of them renders it.
+    The cache key and the options are saved in heatmap.json, which replaces the pending job, if any.
+    :param log_dir: Path of the log directory of the run
+    :param job: dict of options, as returned by `read_heatmap_job()`
+    :param fast: Use the raster renderer, which only needs matplotlib, instead of seaborn
+    :param formats: File formats to save. The seaborn renderer only saves png and pdf
+    :param performances: Map of elites of the run, loaded from the log directory if None
+    """
+    log_dir = Path(log_dir)
+    if not fast and list(formats) != ['png', 'pdf']:
+        raise ValueError("The seaborn renderer saves both png and pdf, use the fast renderer for other formats")
+    if performances is None:
+        # memory-mapped for dense archives, the performances are read while plotting
+        performances = load_performances(log_dir, minimization=job['minimization'])
+
+    # an entry without the cache key first, so that an interrupted render is not cached but keeps the options
+    with open(log_dir / HEATMAP_CACHE_FILE, 'w') as f:
+        json.dump({'options': job}, f, indent=2)
+    for f in ["heatmap.png", "heatmap.pdf"]:
+        try:
+            os.remove(log_dir / f)
+        except OSError:
+            pass
+    # only the renderer in use is imported: the fast one does not need pandas, seaborn and pyplot
+    if fast:
+        from .heatmap_raster import plot_heatmap_raster
+        plot_heatmap_raster(performances, savefig_path=log_dir, formats=formats, **heatmap_job_kwargs(job))
+    else:
+        from .plot_utils import plot_heatmap
+        plot_heatmap(performances, savefig_path=log_dir, interactive=False, plot_annotations=False,
+                     **heatmap_job_kwargs(job))
+    with open(log_dir / HEATMAP_CACHE_FILE, 'w') as f:
+        json.dump(dict(render_key(log_dir, fast, formats), options=job), f, indent=2)
+    if (log_dir / HEATMAP_JOB_FILE).is_file():
+        os.remove(log_dir / HEATMAP_JOB_FILE)
+
+
+def render_heatmap_job(log_dir):
+    """
+    Render the deferred heatmap of a run from its saved map of elites.
+    The job is removed, its options are kept in heatmap.json
+    :param log_dir: Path of the log directory of the run
+    :return: True if a heatmap was rendered
+    """
+    log_dir = Path(log_dir)
+    job = read_heatmap_job(log_dir)
+    if job is None:
+        return False
+    render_heatmap(log_dir, job)
+    return True
+
+
+def spawn_renderer(log_dirs):
+    """
+    Render the deferred heatmaps of some runs in a detached background process, which outlives the caller.
+    Its output goes to `heatmap.log` in the first log directory.
+    :param log_dirs: Paths of the log directories
+    :return: Popen instance of the renderer process
+    """
+    log_dirs = [str(Path(d).resolve()) for d in log_dirs]
+    env = dict(os.environ, MPLBACKEND='Agg')
+    with open(Path(log_dirs[0]) / 'heatmap.log', 'a') as log:
+        return subprocess.Popen([sys.executable, '-m', 'map_elites.deferred_plotting'] + log_dirs,
+                                cwd=Path(__file__).resolve().parents[1], env=env, stdin=subprocess.DEVNULL,
+                                stdout=log, stderr=subprocess.STDOUT, start_new_session=True)
+
+
+if __name__ == "__main__":
+    # python -m map_elites.deferred_plotting <log dir> [<log dir> ...]
+    for d in sys.argv[1:]:
+        render_heatmap_job(d)
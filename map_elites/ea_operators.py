@@ -1,46 +1,73 @@
-import random
+import numpy as np
 
-from itertools import repeat
-from collections import Sequence
+
+def _get_rng(rng):
+    """
+    Return the given random generator, or a new unseeded one
+    """
+    return rng if rng is not None else np.random.default_rng()
+
+
+def _broadcast_param(param, name, size):
+    """
+    Broadcast a scalar or a sequence of per-attribute parameters to an array of `size` elements
+    """
+    param = np.asarray(param, dtype=float)
+    if param.ndim == 0:
+        return np.full(size, param)
+    if len(param) < size:
+        raise IndexError(f"{name} must be at least the size of individual: {len(param)} < {size}")
+    return param[:size]
 
 
 class EaOperators:
+    """
+    Evolutionary operators working either on a single individual of shape (D,)
+    or on a batch of individuals of shape (N, D).
+    All the operators return new arrays and draw their random numbers from `rng`,
+    a `np.random.Generator` instance.
+    """
 
     #################################################
     # CROSSOVER
     #################################################
 
     @staticmethod
-    def uniform_crossover(ind1, ind2, indpb):
+    def uniform_crossover(ind1, ind2, indpb, rng=None):
         """
-        Executes a uniform crossover that modify in place the two
-        individuals. The attributes are swapped according to the
-        *indpb* probability.
+        Executes a uniform crossover on the two individuals (or batches of individuals).
+        The attributes are swapped according to the *indpb* probability.
         :param ind1: The first individual participating in the crossover.
         :param ind2: The second individual participating in the crossover.
         :param indpb: Independent probability for each attribute to be exchanged.
+        :param rng: Random generator
         :returns: A tuple of two individuals.
         """
-        size = min(len(ind1), len(ind2))
-        for i in range(size):
-            if random.random() < indpb:
-                ind1[i], ind2[i] = ind2[i], ind1[i]
+        ind1 = np.array(ind1, dtype=float)
+        ind2 = np.array(ind2, dtype=float)
+        size = min(ind1.shape[-1], ind2.shape[-1])
+        ind1, ind2 = ind1[..., :size], ind2[..., :size]
+        swap = _get_rng(rng).random(ind1.shape) < indpb
+        ind1[swap], ind2[swap] = ind2[swap], ind1[swap]
         return ind1, ind2
 
     @staticmethod
-    def one_point_crossover(ind1, ind2):
+    def one_point_crossover(ind1, ind2, rng=None):
         """
-        Executes a one point crossover on the input individuals.
-        The two individuals are modified in place. The resulting individuals will
-        respectively have the length of the other.
+        Executes a one point crossover on the input individuals (or batches of individuals),
+        with a crossover point drawn for each pair.
         :param ind1: The first individual participating in the crossover.
         :param ind2: The second individual participating in the crossover.
+        :param rng: Random generator
         :returns: A tuple of two individuals.
         """
-        size = min(len(ind1), len(ind2))
-        cxpoint = random.randint(1, size - 1)
-        ind1[cxpoint:], ind2[cxpoint:] = ind2[cxpoint:], ind1[cxpoint:]
-
+        ind1 = np.array(ind1, dtype=float)
+        ind2 = np.array(ind2, dtype=float)
+        size = min(ind1.shape[-1], ind2.shape[-1])
+        ind1, ind2 = ind1[..., :size], ind2[..., :size]
+        cxpoint = _get_rng(rng).integers(1, size, size=ind1.shape[:-1] + (1,))
+        swap = np.broadcast_to(np.arange(size) >= cxpoint, ind1.shape)
+        ind1[swap], ind2[swap] = ind2[swap], ind1[swap]
         return ind1, ind2
 
     #################################################
@@ -48,11 +75,11 @@ class EaOperators:
     #################################################
 
     @staticmethod
-    def gaussian_mutation(individual, mu, sigma, indpb, boundary_management=None, boundaries=None):
+    def gaussian_mutation(individual, mu, sigma, indpb, boundary_management=None, boundaries=None, rng=None):
         """
         This function applies a gaussian mutation of mean *mu* and standard
-        deviation *sigma* on the input individual. This mutation expects a
-        individual composed of real valued attributes.
+        deviation *sigma* on the input individual (or batch of individuals). This mutation expects
+        individuals composed of real valued attributes.
         The *indpb* argument is the probability of each attribute to be mutated.
         :param individual: Individual to be mutated.
         :param mu: Mean or a sequence of means for the
@@ -60,59 +87,34 @@ class EaOperators:
         :param sigma: Standard deviation or a sequence of
                       standard deviations for the gaussian addition mutation.
         :param indpb: Independent probability for each attribute to be mutated.
+        :param boundary_management: How to bring mutated attributes back inside the boundaries:
+                                    `saturation`, `bounce` or `toroidal`. None to ignore the boundaries.
+        :param boundaries: Sequence of (lower, upper) bounds, one for each attribute
+        :param rng: Random generator
         :returns: A tuple of one individual.
         """
-
-        def _default(x, delta, _):
-            return x + delta
-
-        def _saturation(x, delta, boundary):
-            assert boundary[0] <= x <= boundary[1]
-            if delta > 0 and x + delta > boundary[1]:
-                return boundary[1]
-            if delta < 0 and x + delta < boundary[0]:
-                return boundary[0]
-            return x + delta
-
-        def _bounce(x, delta, boundary):
-            assert boundary[0] <= x <= boundary[1]
-            if delta > 0 and x + delta > boundary[1]:
-                return boundary[1] - abs(x + delta - boundary[1])
-            if delta < 0 and x + delta < boundary[0]:
-                return boundary[0] + abs(x + delta - boundary[0])
-            return x + delta
-
-        def _toroidal(x, delta, boundary):
-            assert boundary[0] <= x <= boundary[1]
-            if delta > 0 and x + delta > boundary[1]:
-                return boundary[0] + abs(x + delta - boundary[1])
-            if delta < 0 and x + delta < boundary[0]:
-                return boundary[1] - abs(x + delta - boundary[0])
-            return x + delta
-
-        if boundaries:
-            assert len(individual) == len(boundaries)
-        bound_func = _default
-        if boundary_management == "saturation":
-            bound_func = _saturation
-        if boundary_management == "bounce":
-            bound_func = _bounce
-        if boundary_management == "toroidal":
-            bound_func = _toroidal
-
-        size = len(individual)
-        if not isinstance(mu, Sequence):
-            mu = repeat(mu, size)
-        elif len(mu) < size:
-            raise IndexError(f"mu must be at least the size of individual: {len(mu)} < {size}")
-        if not isinstance(sigma, Sequence):
-            sigma = repeat(sigma, size)
-        elif len(sigma) < size:
-            raise IndexError(f"sigma must be at least the size of individual: {len(sigma)} < {size}")
-
-        for i, m, s, b in zip(range(size), mu, sigma, boundaries):
-            if random.random() < indpb:
-                mut = random.gauss(m, s)
-                individual[i] = bound_func(individual[i], mut, b)
-
-        return individual,
+        rng = _get_rng(rng)
+        individual = np.array(individual, dtype=float)
+        size = individual.shape[-1]
+        mu = _broadcast_param(mu, "mu", size)
+        sigma = _broadcast_param(sigma, "sigma", size)
+
+        mutate = rng.random(individual.shape) < indpb
+        x = individual + np.where(mutate, rng.normal(mu, sigma, individual.shape), 0.)
+
+        if boundaries is not None and boundary_management in ['saturation', 'bounce', 'toroidal']:
+            boundaries = np.asarray(boundaries, dtype=float)
+            assert len(boundaries) == size
+            low, high = boundaries[:, 0], boundaries[:, 1]
+            if boundary_management == "saturation":
+                x = np.clip(x, low, high)
+            elif boundary_management == "bounce":
+                # bounce back by the remaining delta
+                x = np.where(x > high, 2 * high - x, x)
+                x = np.where(x < low, 2 * low - x, x)
+            else:
+                # re-enter from the opposite bound by the remaining delta
+                x = np.where(x > high, low + (x - high), x)
+                x = np.where(x < low, high - (low - x), x)
+
+        return x,
@@ -0,0 +1,85 @@
+import numpy as np
+
+from .archive import StackedArchive
+
+
+class Ensemble:
+    """
+    R independent runs of MAP-Elites advanced together in one process.
+    The maps of elites of the runs are stacked in arrays of shape (R, *grid) and (R, *grid, D).
+    Each run draws parents, variation and bootstrap solutions from its own random stream, spawned
+    from the seed of the task, while the offspring of all the runs are evaluated as a single
+    (R * N, D) batch, so the evaluation overhead is paid once per generation for all the runs.
+    """
+
+    def __init__(self, task, runs):
+        """
+        :param task: MapElites instance providing the function, the operators, the feature dimensions,
+            the evaluator and the number of iterations and offspring per generation of each run
+        :param runs: Number of independent runs
+        """
+        self.task = task
+        self.runs = runs
+        # imported here, mapelites imports this module
+        from .mapelites import ENSEMBLE_STREAM
+
+        # independent streams, one per run
+        self.rngs = [task.spawn_rng(ENSEMBLE_STREAM, r) for r in range(runs)]
+
+        # the task does not allocate a map of elites of its own in ensemble mode
+        shape = tuple(len(ft.bins) - 1 for ft in task.feature_dimensions)
+        dimensions = task.F.D
+        self.performances = np.full((runs,) + shape, np.inf)
+        self.solutions = np.full((runs,) + shape + (dimensions,), np.inf)
+        self.archives = [StackedArchive(self.performances[r], self.solutions[r], minimization=task.minimization)
+                         for r in range(runs)]
+
+    def run(self, pbar=None):
+        """
+        Bootstrap all the runs and iterate until each of them evaluated `task.iterations` offspring,
+        or until `task.stopping_criteria()` is met. `task.evaluations` counts the offspring of a single run
+        :param pbar: TQDM progress bar instance, updated with the evaluations of a single run
+        """
+        task = self.task
+        X = np.concatenate([task.generate_random_solutions(task.random_solutions, rng=rng) for rng in self.rngs])
+        self.evaluate_and_place(X)
+
+        while task.evaluations < task.iterations:
+            if task.stopping_criteria():
+                break
+            n = min(task.batch_size, task.iterations - task.evaluations)
+            X = np.concatenate([task.generate_offspring(n, archive=archive, rng=rng)
+                                for archive, rng in zip(self.archives, self.rngs)])
+            self.evaluate_and_place(X, pbar=pbar)
+            task.evaluations += n
+
+    def evaluate_and_place(self, X, pbar=None):
+        """
+        Evaluate the offspring of all the runs as one batch and place them in the map of elites of their run
+        :param X: array of shape (R * N, D), the N offspring of each run one after the other
+        :param pbar: TQDM progress bar instance
+        """
+        task = self.task
+        with task.timer.phase('evaluation', items=len(X)):
+            perfs, cells, in_range = task.evaluator.evaluate(X)
+        n = len(X) // self.runs
+        with task.timer.phase('placement', items=len(X)):
+            for r, archive in enumerate(self.archives):
+                rows = slice(r * n, (r + 1) * n)
+                valid = in_range[rows]
+                archive.insert_batch(cells[rows][valid], perfs[rows][valid], X[rows][valid])
+        if not np.all(in_range):
+            task.logger.warning(f"PLACE: {np.sum(~in_range)} individuals outside of the bins discarded")
+        if pbar is not None:
+            pbar.update(n)
+
+    def save(self, log_dir):
+        """
+        Save each run in its own sub-directory `1` to `R` of the log directory,
+        with the same files as a single run
+        :param log_dir: Path of the log directory
+        """
+        for r, archive in enumerate(self.archives, 1):
+            run_dir = log_dir / str(r)
+            run_dir.mkdir(exist_ok=True)
+            archive.save(run_dir)
@@ -0,0 +1,153 @@
+import os
+import multiprocessing
+
+import numpy as np
+
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+
+# evaluation task of the current worker process, set once by the pool initializer
+_worker_task = None
+
+
+def _init_worker(task):
+    """
+    Process pool initializer: receive the evaluation task once per worker
+    """
+    global _worker_task
+    _worker_task = task
+
+
+def _evaluate_in_worker(X):
+    return _worker_task.evaluate_solutions(X)
+
+
+class Evaluator(ABC):
+    """
+    Evaluates batches of solutions on behalf of MAP-Elites.
+    The evaluation task is any object implementing `evaluate_solutions(X)`, returning a tuple
+    of arrays aligned with the rows of X (performances, cells in the feature space and in-range mask).
+    The map of elites is never sent to the evaluator, placement is always done by the caller.
+    """
+
+    def __init__(self, workers=None):
+        """
+        :param workers: Number of parallel workers. None or 0 to use all the available cores
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.task = None
+
+    def start(self, task):
+        """
+        Bind the evaluation task and start the workers
+        :param task: object implementing `evaluate_solutions(X)`
+        """
+        self.task = task
+
+    def close(self):
+        """
+        Stop the workers
+        """
+        pass
+
+    @abstractmethod
+    def submit(self, X):
+        """
+        Schedule the evaluation of a batch of solutions
+        :param X: array of shape (N, D) of genotypes
+        :return: a `concurrent.futures.Future` resolving to the tuple returned by `evaluate_solutions(X)`
+        """
+        pass
+
+    def evaluate(self, X):
+        """
+        Evaluate a batch of solutions, splitting it evenly among the workers
+        :param X: array of shape (N, D) of genotypes
+        :return: the tuple returned by `evaluate_solutions(X)` for the whole batch
+        """
+        chunks = np.array_split(X, min(self.workers, len(X)))
+        results = [f.result() for f in [self.submit(c) for c in chunks]]
+        return tuple(np.concatenate(r) for r in zip(*results))
+
+
+class SerialEvaluator(Evaluator):
+    """
+    Evaluate the solutions in the calling thread
+    """
+
+    def __init__(self, workers=None):
+        super().__init__(workers=1)
+
+    def submit(self, X):
+        future = Future()
+        try:
+            future.set_result(self.task.evaluate_solutions(X))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class ThreadPoolEvaluator(Evaluator):
+    """
+    Evaluate the solutions in a pool of threads sharing the evaluation task.
+    Effective when the evaluation releases the GIL, e.g. large NumPy operations or native code
+    """
+
+    def __init__(self, workers=None):
+        super().__init__(workers)
+        self.executor = None
+
+    def start(self, task):
+        super().start(task)
+        self.executor = ThreadPoolExecutor(max_workers=self.workers)
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def submit(self, X):
+        return self.executor.submit(self.task.evaluate_solutions, X)
+
+
+class ProcessPoolEvaluator(Evaluator):
+    """
+    Evaluate the solutions in a pool of processes.
+    The evaluation task is pickled once per worker at pool start, then only
+    the genotypes and the results travel between the processes
+    """
+
+    def __init__(self, workers=None, mp_context=None):
+        """
+        :param workers: Number of worker processes. None or 0 to use all the available cores
+        :param mp_context: Start method of the workers (`fork`, `spawn` or `forkserver`) or multiprocessing
+            context. None for the default of the platform
+        """
+        super().__init__(workers)
+        if isinstance(mp_context, str):
+            mp_context = multiprocessing.get_context(mp_context)
+        self.mp_context = mp_context
+        self.executor = None
+
+    def start(self, task):
+        super().start(task)
+        self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                            mp_context=self.mp_context,
+                                            initializer=_init_worker,
+                                            initargs=(task,))
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def submit(self, X):
+        return self.executor.submit(_evaluate_in_worker, X)
+
+
+EVALUATORS = {
+    'serial': SerialEvaluator,
+    'thread': ThreadPoolEvaluator,
+    'process': ProcessPoolEvaluator
+}
@@ -26,7 +26,8 @@ class FeatureDimension:
         if self.feature_function_operator not in [operator.eq, operator.le, operator.lt, operator.ge, operator.gt]:
             raise ValueError(f"Feature function operator not recognized")
 
-        self.bins = bins
+        # bins are stored once as a contiguous array, searched by discretize_batch()
+        self.bins = np.ascontiguousarray(bins, dtype=float)
 
     def feature_descriptor(self, x):
         """
@@ -34,17 +35,40 @@ class FeatureDimension:
         :param x: genotype of candidate solution x
         :return: The amount of error from the feature descriptor bound
         """
+        return self.feature_descriptor_value(self.feature_function_call(x), self.feature_function_target(x))
+
+    def feature_descriptor_value(self, value, target):
+        """
+        Compute the feature descriptor from an already simulated feature value and its target
+        :param value: feature function value
+        :param target: feature function target
+        :return: The amount of error from the feature descriptor bound
+        """
         if self.feature_function_operator == operator.eq:
-            return math.fabs(self.feature_function_call(x) - self.feature_function_target(x))
+            return math.fabs(value - target)
         else:
-            if self.feature_function_operator(
-                    self.feature_function_call(x),
-                    self.feature_function_target(x)):
+            if self.feature_function_operator(value, target):
                 # return negative number instead of 0 because the discretize() function includes
                 # the lower bound value into the following bin. So 0 would result in the second bin.
                 return -.1
             else:
-                return math.fabs(self.feature_function_call(x) - self.feature_function_target(x))
+                return math.fabs(value - target)
+
+    def feature_descriptor_batch(self, values, targets):
+        """
+        Vectorized version of `feature_descriptor()` working on already computed
+        feature function values and targets
+        :param values: array of shape (N,) of feature function values
+        :param targets: array of shape (N,) of feature function targets
+        :return: array of shape (N,) with the amount of error from the feature descriptor bound
+        """
+        values = np.asarray(values, dtype=float)
+        targets = np.asarray(targets, dtype=float)
+        error = np.abs(values - targets)
+        if self.feature_function_operator == operator.eq:
+            return error
+        # satisfied features get -.1 for the same reason as in feature_descriptor()
+        return np.where(self.feature_function_operator(values, targets), -.1, error)
 
     def discretize(self, value):
         """
@@ -55,3 +79,59 @@ class FeatureDimension:
             raise Exception(f"Constraint {self.name}: value {value} outside of bins {self.bins}")
         # - 1 because digitize is 1-indexed
         return index - 1
+
+    def discretize_batch(self, values):
+        """
+        Vectorized version of `discretize()`. Values outside of the bins are flagged instead of raising
+        :param values: array of shape (N,) of real values
+        :return: array of shape (N,) of bin indices and boolean array of shape (N,),
+            False where the value is outside of the bins
+        """
+        # same as np.digitize(values, self.bins, right=True)
+        index = np.searchsorted(self.bins, values, side='left')
+        in_range = (index > 0) & (index < len(self.bins))
+        return index - 1, in_range
+
+
+def discretize_batch(feature_dimensions, descriptors):
+    """
+    Flat indices (C order) of the cells of a batch of feature descriptors,
+    with one binary search per feature dimension
+    :param feature_dimensions: list of FeatureDimension objects
+    :param descriptors: array of shape (N, number of feature dimensions) of feature descriptors
+    :return: array of shape (N,) of flat indices and boolean array of shape (N,), False for the rows
+        with at least one descriptor outside of the bins. The flat index of those rows is -1
+    """
+    descriptors = np.asarray(descriptors, dtype=float)
+    cells = np.zeros(len(descriptors), dtype=np.intp)
+    in_range = np.ones(len(descriptors), dtype=bool)
+    for j, ft in enumerate(feature_dimensions):
+        index, valid = ft.discretize_batch(descriptors[:, j])
+        cells = cells * (len(ft.bins) - 1) + index
+        in_range &= valid
+    cells[~in_range] = -1
+    return cells, in_range
+
+
+def parse_bins(value):
+    """
+    Parse the bins of a feature dimension as written in config.ini, e.g. `inf,0,0.0001,0.01,1.0,inf`.
+    The `inf` label at the beginning and at the end of the bins stands for -np.inf and np.inf
+    :param value: comma separated bins
+    :return: list of floats
+    """
+    b = value.split(',')
+    inf_start = (b[0] == "inf")
+    inf_end = (b[len(b)-1] == "inf")
+    if inf_start:
+        b.pop(0)
+    if inf_end:
+        b.pop(len(b)-1)
+    # convert strings to floats
+    b = list(map(float, b))
+    # add back the inf values
+    if inf_start:
+        b.insert(0, -np.inf)
+    if inf_end:
+        b.insert(len(b), np.inf)
+    return b
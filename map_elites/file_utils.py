@@ -0,0 +1,12 @@
+import os
+
+
+def listdir_nohidden(path):
+    """
+    Names of the entries of a directory, except the hidden ones
+    :param path: Path of the directory
+    :return: generator of names, in sorted order
+    """
+    for f in sorted(os.listdir(path)):
+        if not f.startswith('.'):
+            yield f
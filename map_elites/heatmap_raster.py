@@ -0,0 +1,134 @@
+import numpy as np
+import matplotlib.ticker as ticker
+
+from matplotlib import colormaps
+from matplotlib.colors import ListedColormap
+from matplotlib.figure import Figure
+
+
+def heatmap_matrix(data):
+    """
+    Reshape an N-dimensional map of elites (up to 4 dimensions) into the 2D matrix shown by the heatmap,
+    with the dimensions 3 and 4 nested inside the bins of the dimensions 1 and 2
+    :param data: array of performances
+    :return: 2D array, rows are the y axis
+    """
+    d = data.shape
+    data = np.asarray(data)
+    if len(d) == 1:
+        data = data[None, :]
+    if len(d) == 2:
+        data = data.transpose()
+    if len(d) == 3:
+        data = np.transpose(data, axes=(1, 0, 2)).reshape((d[1], d[0] * d[2]))
+    if len(d) == 4:
+        _data = np.transpose(data, axes=[1, 0, 2, 3])
+        data = np.transpose(_data.reshape((d[1], d[0] * d[2], d[3])), axes=[0, 2, 1]).reshape(
+            (d[1] * d[3], d[0] * d[2]))
+    return data
+
+
+def set_heatmap_axes(ax, d, x_axis, y_axis):
+    """
+    Set the bin labels of the first two dimensions and draw the thick lines separating the nested dimensions
+    :param ax: Axes of the heatmap
+    :param d: Shape of the map of elites
+    """
+    # set ticks
+    y_ticks_pos = [0.5]
+    x_ticks_pos = range(0, d[0]+1)
+    if len(d) > 1:
+        y_ticks_pos = range(0, d[1]+1)
+    if len(d) > 2:
+        x_ticks_pos = range(0, d[0]*d[2]+1, d[2])
+    if len(d) > 3:
+        y_ticks_pos = range(0, d[1]*d[3]+1, d[3])
+
+    if y_axis[0] == "-inf":
+        y_axis[0] = ""
+    if x_axis[0] == "-inf":
+        x_axis[0] = ""
+    if y_axis[len(y_axis) - 1] == "inf":
+        y_axis[len(y_axis) - 1] = ""
+    if x_axis[len(x_axis) - 1] == "inf":
+        x_axis[len(x_axis) - 1] = ""
+
+    ax.xaxis.set_major_locator(ticker.FixedLocator(x_ticks_pos))
+    ax.xaxis.set_major_formatter(ticker.FixedFormatter(x_axis))
+
+    ax.yaxis.set_major_locator(ticker.FixedLocator(y_ticks_pos))
+    ax.yaxis.set_major_formatter(ticker.FixedFormatter(y_axis))
+
+    # show grid lines
+    thick_grid_color = 'k'
+    thick_grid_width = 2
+    if len(d) == 3:
+        ax.vlines(
+            list(range(0, d[0] * d[2], d[2])),
+            *ax.get_ylim(),
+            colors=thick_grid_color,
+            linewidths=thick_grid_width
+        )
+        ax.hlines(
+            list(range(0, d[1])),
+            *ax.get_xlim(),
+            colors=thick_grid_color,
+            linewidths=thick_grid_width
+        )
+    if len(d) == 4:
+        ax.vlines(
+            list(range(0, d[0] * d[2] + 1, d[2])),
+            *ax.get_ylim(),
+            colors=thick_grid_color,
+            linewidths=thick_grid_width
+        )
+        ax.hlines(
+            list(range(0, d[1] * d[3] + 1, d[3])),
+            *ax.get_xlim(),
+            colors=thick_grid_color,
+            linewidths=thick_grid_width
+        )
+
+
+def plot_heatmap_raster(data,
+                        x_axis=None,
+                        y_axis=None,
+                        title="MapElites fitness map",
+                        minimization=True,
+                        savefig_path=None,
+                        highlight_best=True,
+                        formats=('png',),
+                        dpi=100):
+    """
+    Fast version of `plot_heatmap()` for large grids and batch rendering.
+    The map of elites is drawn as a single image with matplotlib only, without pyplot, pandas and seaborn,
+    and saved to `heatmap.{format}` for each of the formats.
+    Annotations and interactive display are not supported.
+    :param formats: File formats to save, e.g. ('png', 'pdf')
+    :param dpi: Resolution of the raster formats
+    """
+    title = f"{title} - white cells: null values"
+    d = data.shape
+    data = np.ma.masked_invalid(heatmap_matrix(data))
+
+    fig = Figure(figsize=(10, 10))
+    ax = fig.add_subplot()
+    cmap = colormaps["YlGnBu"].copy()
+    cmap.set_bad('white')
+    # pixel (i, j) covers [j, j + 1] x [i, i + 1], as the cells of plot_heatmap()
+    extent = (0, data.shape[1], 0, data.shape[0])
+    image = ax.imshow(data, cmap=cmap, origin='lower', extent=extent, aspect='auto', interpolation='nearest')
+    fig.colorbar(image, ax=ax)
+
+    if highlight_best and data.count() > 0:
+        best = data.min() if minimization else data.max()
+        title = f"{title} - red cell: best value"
+        ax.imshow(np.ma.masked_where(data != best, data), cmap=ListedColormap(['#67000d']),
+                  origin='lower', extent=extent, aspect='auto', interpolation='nearest')
+
+    ax.set_title(title)
+    set_heatmap_axes(ax, d, list(x_axis), list(y_axis))
+
+    if savefig_path:
+        for f in formats:
+            fig.savefig(savefig_path / f"heatmap.{f}", dpi=dpi)
@@ -0,0 +1,153 @@
+import json
+
+import numpy as np
+
+from pathlib import Path
+
+from .archive import ARCHIVES
+
+
+INSERTION_LOG_FILE = 'insertions.bin'
+# header size is a multiple of this value, so the records are aligned in the file
+HEADER_ALIGNMENT = 64
+
+
+def record_dtype(dimensions):
+    """
+    Fixed-size record of the insertion log
+    :param dimensions: Number of dimensions of the solutions
+    """
+    return np.dtype([('evaluation', '<i8'),
+                     ('cell', '<i8'),
+                     ('performance', '<f8'),
+                     ('accepted', '?'),
+                     ('genotype', '<f8', (dimensions,))])
+
+
+class InsertionLog:
+    """
+    Append-only binary log of all the solutions offered to the map of elites.
+    The file starts with a JSON header padded with spaces (shape of the grid, dimensions of the solutions,
+    minimization, record dtype), followed by one fixed-size record per evaluation: evaluation index,
+    flat cell index (-1 if outside of the feature space), performance, accepted flag and genotype.
+    Records are written through a buffered file, so logging costs one memory copy per batch.
+    """
+
+    def __init__(self, path, shape, dimensions, minimization=True, records=None, buffer_size=1 << 20):
+        """
+        :param path: Path of the log file
+        :param shape: Number of bins of each feature dimension
+        :param dimensions: Number of dimensions of the solutions
+        :param minimization: True if solving a minimization problem. False if solving a maximization problem.
+        :param records: Number of records of an existing log to keep and append to.
+            None to create a new log
+        :param buffer_size: Size in bytes of the write buffer
+        """
+        self.path = Path(path)
+        self.dtype = record_dtype(dimensions)
+        header = json.dumps({'shape': [int(s) for s in shape],
+                             'dimensions': int(dimensions),
+                             'minimization': bool(minimization),
+                             'descr': np.lib.format.dtype_to_descr(self.dtype)})
+        # pad the header with spaces, the newline ends it
+        length = -(-(len(header) + 1) // HEADER_ALIGNMENT) * HEADER_ALIGNMENT
+        header = (header.ljust(length - 1) + '\n').encode()
+        self.offset = len(header)
+
+        if records is None:
+            self.records = 0
+            self._file = open(self.path, 'wb', buffering=buffer_size)
+            self._file.write(header)
+        else:
+            # drop the records written after the checkpoint being resumed
+            size = self.offset + records * self.dtype.itemsize
+            if self.path.stat().st_size < size:
+                raise ValueError(f"Insertion log {self.path} has less than {records} records")
+            self.records = records
+            self._file = open(self.path, 'r+b', buffering=buffer_size)
+            self._file.truncate(size)
+            self._file.seek(size)
+
+    def write(self, cells, perfs, X, accepted):
+        """
+        Append one record per evaluated solution, in order of evaluation
+        :param cells: array of shape (N,) of flat indices, -1 for the solutions outside of the feature space
+        :param perfs: array of shape (N,) of performances
+        :param X: array of shape (N, D) of genotypes
+        :param accepted: boolean array of shape (N,), True for the solutions placed in the map of elites
+        """
+        records = np.empty(len(cells), dtype=self.dtype)
+        records['evaluation'] = np.arange(self.records, self.records + len(cells))
+        records['cell'] = cells
+        records['performance'] = perfs
+        records['accepted'] = accepted
+        records['genotype'] = X
+        self._file.write(records.tobytes())
+        self.records += len(cells)
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+def read_insertion_log(path):
+    """
+    Open an insertion log without loading it in memory
+    :param path: Path of the log file, or of the log directory containing it
+    :return: dict with the header of the log and memory-mapped array of records
+    """
+    path = Path(path)
+    if path.is_dir():
+        path = path / INSERTION_LOG_FILE
+    with open(path, 'rb') as f:
+        line = f.readline()
+    header = json.loads(line)
+    dtype = record_dtype(header['dimensions'])
+    n = (path.stat().st_size - len(line)) // dtype.itemsize
+    header['records'] = np.memmap(path, dtype=dtype, mode='r', offset=len(line), shape=(n,))
+    return header
+
+
+def replay(path, evaluations=None, archive='dense'):
+    """
+    Rebuild the map of elites as it was after a number of evaluations
+    :param path: Path of the log file, or of the log directory containing it
+    :param evaluations: Number of evaluations to replay. None to replay the whole log
+    :param archive: Storage of the rebuilt map of elites, one of the keys of `ARCHIVES`
+        (`memmap` archives are created in the current directory)
+    :return: Archive instance
+    """
+    log = read_insertion_log(path)
+    records = log['records'][:evaluations]
+    accepted = records[records['accepted']]
+    # every accepted solution replaced the previous elite of its cell, so the last one of each cell is the elite
+    cells, last = np.unique(accepted['cell'][::-1], return_index=True)
+    elites = accepted[len(accepted) - 1 - last]
+    result = ARCHIVES[archive](log['shape'], log['dimensions'], minimization=log['minimization'])
+    result.restore(cells, elites['performance'], elites['genotype'])
+    return result
+
+
+def anytime_curves(path):
+    """
+    Anytime performance of a run, computed from its insertion log
+    :param path: Path of the log file, or of the log directory containing it
+    :return: arrays of shape (evaluations,) with the best performance in the map of elites
+        and the number of occupied cells after each evaluation
+    """
+    log = read_insertion_log(path)
+    records = log['records']
+    perfs = np.where(records['accepted'], records['performance'], np.inf if log['minimization'] else -np.inf)
+    if log['minimization']:
+        best = np.minimum.accumulate(perfs)
+    else:
+        best = np.maximum.accumulate(perfs)
+    # a cell is occupied by its first accepted solution
+    accepted = np.flatnonzero(records['accepted'])
+    _, first = np.unique(records['cell'][accepted], return_index=True)
+    filled = np.zeros(len(records), dtype=np.intp)
+    filled[accepted[first]] = 1
+    return best, np.cumsum(filled)
@@ -1,22 +1,36 @@
 import time
 import logging
-import operator
 import configparser
 
 import numpy as np
 
 from tqdm import tqdm
 from pathlib import Path
+from concurrent.futures import wait, FIRST_COMPLETED
 from shutil import copyfile
 from datetime import datetime
-from itertools import permutations
 from abc import ABC, abstractmethod
 
 # local imports
-import functions
-from .feature_dimension import FeatureDimension
-from .plot_utils import plot_heatmap
+# plot_utils (matplotlib, pandas, seaborn) and functions are imported when needed,
+# to keep the startup of short-lived and headless processes fast
+from .feature_dimension import FeatureDimension, parse_bins
 from .ea_operators import EaOperators
+from .archive import ARCHIVES, MemmapArchive, SparseArchive
+from .evaluators import EVALUATORS, SerialEvaluator
+from .checkpoint import CHECKPOINT_FILE, Checkpointer, load_checkpoint
+from .insertion_log import INSERTION_LOG_FILE, InsertionLog
+from .profiling import PhaseTimer
+from .sampling import SAMPLERS
+from .ensemble import Ensemble
+from .deferred_plotting import write_heatmap_job, spawn_renderer
+
+
+# keys of the random streams spawned from the seed, see `MapElites.spawn_rng()`
+BOOTSTRAP_STREAM = 0
+VARIATION_STREAM = 1
+BATCH_STREAM = 2
+ENSEMBLE_STREAM = 3
 
 
 class MapElites(ABC):
@@ -37,7 +51,23 @@ class MapElites(ABC):
                  overwrite_log_dir,
                  config_path,
                  seed,
-                 minimization=True
+                 minimization=True,
+                 batch_size=1,
+                 evaluator=None,
+                 steady_state=False,
+                 max_in_flight=8,
+                 archive='dense',
+                 checkpoint_every=0,
+                 checkpoint_seconds=0,
+                 log_insertions=False,
+                 profile=False,
+                 profile_interval=0,
+                 ensemble_runs=1,
+                 headless=False,
+                 progress_bar=True,
+                 plot_mode='sync',
+                 bootstrap_sampling='uniform',
+                 resume=False
                  ):
         """
         :param iterations: Number of evolutionary iterations
@@ -51,24 +81,84 @@ class MapElites(ABC):
         :param crossover_args: Crossover function arguments
         :param bins: Bins for feature dimensions
         :param minimization: True if solving a minimization problem. False if solving a maximization problem.
+        :param batch_size: Number of offspring generated, evaluated and placed together in each generation
+        :param evaluator: Evaluator instance used to evaluate batches of offspring. Defaults to a SerialEvaluator
+        :param steady_state: Run the asynchronous steady-state loop instead of the generational one
+        :param max_in_flight: Maximum number of batches being evaluated at the same time in steady-state mode.
+            A fixed number, independent of the number of evaluator workers
+        :param archive: Storage of the map of elites, one of the keys of `ARCHIVES`:
+            `dense` grids, `memmap` grids memory-mapped in the log directory
+            or `sparse` storage of the occupied cells only
+        :param checkpoint_every: Write a checkpoint every `checkpoint_every` evaluations. 0 to disable
+        :param checkpoint_seconds: Write a checkpoint every `checkpoint_seconds` seconds. 0 to disable
+        :param log_insertions: Write every evaluated solution (bootstrap included) to the binary insertion log
+            in the log directory, see `insertion_log.py`
+        :param profile: Time the phases of the main loop and write the timings to `timings.json` in the log directory
+        :param profile_interval: Append a snapshot of the timings to `timings.jsonl` every `profile_interval` seconds.
+            0 to disable
+        :param ensemble_runs: Number of independent runs advanced together in one process, see `Ensemble`.
+            1 for a single run
+        :param headless: Do not plot the heatmap at the end of the run, the plotting libraries are never imported
+        :param progress_bar: Show the progress bar of the iterations on stderr
+        :param plot_mode: How the heatmap is plotted at the end of the run: `sync` before `run()` returns,
+            `background` by a detached renderer process, or `deferred` to a job file in the log directory
+            rendered later by generate_heatmaps.py. Ignored if headless
+        :param bootstrap_sampling: Sampling of the initial solutions in the domain, one of the keys of `SAMPLERS`:
+            `uniform` random, `lhs` Latin hypercube, scrambled `sobol` or scrambled `halton` sequences
+        :param resume: Continue the run checkpointed in the log directory, keeping its config file and log.
+            The checkpoint is loaded by `resume_from_checkpoint()`
         """
-        # set random seed
-        self.seed = seed
-        np.random.seed(self.seed)
+        # all the random numbers come from independent streams derived from the seed,
+        # a run without seed draws one from the OS entropy
+        self.seed = seed if seed is not None else np.random.SeedSequence().entropy
+        # random generators of the initial solutions and of the selection and variation of the classic loop
+        self.bootstrap_rng = self.spawn_rng(BOOTSTRAP_STREAM)
+        self.rng = self.spawn_rng(VARIATION_STREAM)
         self.elapsed_time = 0
+        # number of evaluations of the main loop (bootstrap excluded)
+        self.evaluations = 0
+        self.resumed = False
+        self.timer = PhaseTimer(enabled=profile, interval=profile_interval)
 
         self.minimization = minimization
-        # set the choice operator either to do a minimization or a maximization
-        if self.minimization:
-            self.place_operator = operator.lt
-        else:
-            self.place_operator = operator.ge
 
         self.plot_args = plot_args
+        self.headless = headless
+        self.progress_bar = progress_bar
+        if plot_mode not in ['sync', 'background', 'deferred']:
+            raise ValueError(f"MapElites: `plot_mode` must be one of ['sync', 'background', 'deferred'], "
+                             f"got {plot_mode}")
+        self.plot_mode = plot_mode
 
         self.F = optimization_function(optimization_function_dimensions)
         self.iterations = iterations
         self.random_solutions = bootstrap_individuals
+        if bootstrap_sampling not in SAMPLERS:
+            raise ValueError(f"MapElites: `bootstrap_sampling` must be one of {list(SAMPLERS.keys())}, "
+                             f"got {bootstrap_sampling}")
+        self.bootstrap_sampling = bootstrap_sampling
+        if batch_size < 1:
+            raise ValueError(f"MapElites: `batch_size` must be a positive integer, got {batch_size}")
+        self.batch_size = batch_size
+        self.evaluator = evaluator if evaluator is not None else SerialEvaluator()
+        self.steady_state = steady_state
+        self.ensemble_runs = ensemble_runs
+        if self.ensemble_runs < 1:
+            raise ValueError(f"MapElites: `ensemble_runs` must be a positive integer, got {ensemble_runs}")
+        # the runs of an ensemble are stored together in RAM, see `Ensemble`
+        if self.ensemble_runs > 1 and (steady_state or checkpoint_every or checkpoint_seconds or log_insertions
+                                       or archive != 'dense'):
+            raise ValueError("MapElites: ensemble runs do not support steady-state mode, checkpoints, "
+                             "insertion logs and archives other than `dense`")
+        if not isinstance(self.evaluator, SerialEvaluator) and self.batch_size == 1 and not self.steady_state \
+                and self.ensemble_runs == 1:
+            raise ValueError("MapElites: parallel evaluators require `batch_size` greater than 1, "
+                             "steady-state mode or ensemble runs")
+        # a fixed number, so that the batches in flight do not depend on the number of cores of the machine
+        if self.steady_state and max_in_flight < 1:
+            raise ValueError(f"MapElites: steady-state mode requires `max_in_flight` to be a positive integer, "
+                             f"got {max_in_flight}")
+        self.max_in_flight = max_in_flight
         self.bins = bins
 
         self.mutation_op = mutation_op
@@ -90,12 +180,8 @@ class MapElites(ABC):
         # get number of bins for each feature dimension
         ft_bins = [len(ft.bins) - 1 for ft in self.feature_dimensions]
 
-        # Map of Elites: Initialize data structures to store solutions and fitness values
-        self.solutions = np.full(
-            ft_bins, (np.inf, ) * optimization_function_dimensions,
-            dtype=(float, optimization_function_dimensions)
-        )
-        self.performances = np.full(ft_bins, np.inf)
+        if archive not in ARCHIVES:
+            raise ValueError(f"The archive must be one of {list(ARCHIVES.keys())}")
 
         if log_dir:
             self.log_dir_path = Path(log_dir)
@@ -104,15 +190,37 @@ class MapElites(ABC):
             self.log_dir_name = f"log_{now}"
             self.log_dir_path = Path(f'logs/{self.log_dir_name}')
         # create log dir
-        self.log_dir_path.mkdir(parents=True, exist_ok=overwrite_log_dir)
-        # save config file
-        copyfile(config_path, self.log_dir_path / 'config.ini')
+        self.log_dir_path.mkdir(parents=True, exist_ok=overwrite_log_dir or resume)
+        # save config file, a resumed run already has it
+        if not resume:
+            copyfile(config_path, self.log_dir_path / 'config.ini')
+
+        # Map of Elites: Initialize data structures to store solutions and fitness values
+        # the runs of an ensemble have their own maps of elites, allocated by `Ensemble`
+        self.archive = None
+        if self.ensemble_runs == 1:
+            archive_args = dict(minimization=self.minimization)
+            if issubclass(ARCHIVES[archive], MemmapArchive):
+                # memory-mapped files are created in the log dir
+                archive_args['path'] = self.log_dir_path
+            self.archive = ARCHIVES[archive](ft_bins, optimization_function_dimensions, **archive_args)
+
+        # a resumed run reopens its insertion log when restoring the checkpoint
+        self.log_insertions = log_insertions
+        self.insertion_log = None
+        if self.log_insertions and not resume:
+            self.insertion_log = InsertionLog(self.log_dir_path / INSERTION_LOG_FILE, ft_bins,
+                                              optimization_function_dimensions, minimization=self.minimization)
+
+        self.checkpointer = Checkpointer(self.log_dir_path / CHECKPOINT_FILE,
+                                         every=checkpoint_every,
+                                         seconds=checkpoint_seconds)
 
         # Setup logging
         self.logger = logging.getLogger('map_elites')
         self.logger.setLevel(logging.DEBUG)
         # create file handler which logs even debug messages
-        fh = logging.FileHandler(self.log_dir_path / 'log.log', mode='w')
+        fh = logging.FileHandler(self.log_dir_path / 'log.log', mode='a' if resume else 'w')
         fh.setLevel(logging.INFO)
         self.logger.addHandler(fh)
 
@@ -121,13 +229,15 @@ class MapElites(ABC):
         print(f"\tUsing random seed {self.seed}")
 
     @classmethod
-    def from_config(cls, config_path, log_dir=None, func=None, overwrite=False):
+    def from_config(cls, config_path, log_dir=None, func=None, overwrite=False, resume=False, headless=None):
         """
         Read config file and create a MAP-Elites instance.
         :param config_path: Path to config.ini file
         :param log_dir: Absolute path to logging directory
         :param func: Name of optimization function to use
         :param overwrite: Overwrite the log directory if already exists
+        :param resume: Continue the run checkpointed in the log directory
+        :param headless: Do not plot the heatmap at the end of the run. None to use the config file
         """
         # Read configuration file
         config = configparser.ConfigParser()
@@ -136,17 +246,37 @@ class MapElites(ABC):
         # RANDOM SEED
         seed = config['mapelites'].getint('seed')
         if not seed:
-            seed = np.random.randint(0, 100)
+            seed = int(np.random.SeedSequence().generate_state(1)[0])
 
         # MAIN MAPELITES CONF
         iterations = config['mapelites'].getint('iterations')
         bootstrap_individuals = config['mapelites'].getint('bootstrap_individuals')
+        bootstrap_sampling = config['mapelites'].get('bootstrap_sampling', fallback='uniform')
         minimization = config['mapelites'].getboolean('minimization')
+        batch_size = config['mapelites'].getint('batch_size', fallback=1)
+
+        # EVALUATOR
+        evaluator_name = config['mapelites'].get('evaluator', fallback='serial')
+        if evaluator_name not in EVALUATORS:
+            raise ValueError(f"The evaluator must be one of {list(EVALUATORS.keys())}")
+        evaluator = EVALUATORS[evaluator_name](workers=config['mapelites'].getint('workers', fallback=0))
+        steady_state = config['mapelites'].getboolean('steady_state', fallback=False)
+        max_in_flight = config['mapelites'].getint('max_in_flight', fallback=8)
+        archive = config['mapelites'].get('archive', fallback='dense')
+        checkpoint_every = config['mapelites'].getint('checkpoint_every', fallback=0)
+        checkpoint_seconds = config['mapelites'].getfloat('checkpoint_seconds', fallback=0)
+        log_insertions = config['mapelites'].getboolean('log_insertions', fallback=False)
+        profile = config['mapelites'].getboolean('profile', fallback=False)
+        profile_interval = config['mapelites'].getfloat('profile_interval', fallback=0)
+        ensemble_runs = config['mapelites'].getint('ensemble_runs', fallback=1)
 
         # PLOTTING CONF
         plot_args = dict()
         plot_args['highlight_best'] = config['plotting'].getboolean('highlight_best')
         plot_args['interactive'] = config['mapelites'].getboolean('interactive')
+        if headless is None:
+            headless = config['plotting'].getboolean('headless', fallback=False)
+        plot_mode = config['plotting'].get('mode', fallback='sync')
 
         # OPTIMIZATION FUNCTION
         # override config parameter in case it was specified from command line
@@ -155,7 +285,19 @@ class MapElites(ABC):
         else:
             function_name = config['opt_function']['name']
         function_dimensions = config['opt_function'].getint('dimensions')
-        function_class = getattr(functions, function_name)
+        backend = config['opt_function'].get('backend', fallback='python')
+        import functions
+        if backend == 'python':
+            functions_module = functions
+        elif backend == 'native':
+            # imported here since it compiles the C functions on first use
+            import native_functions
+            functions_module = native_functions
+        else:
+            raise ValueError(f"The optimization function backend must be one of ['python', 'native']")
+        if not hasattr(functions_module, function_name):
+            raise ValueError(f"Optimization function {function_name} not available in the {backend} backend")
+        function_class = getattr(functions_module, function_name)
 
         if not issubclass(function_class, functions.ConstrainedFunction):
             raise ValueError(
@@ -165,25 +307,8 @@ class MapElites(ABC):
         # BINS
         d = dict(config.items('opt_function'))
         bins_names = filter(lambda s: s.startswith("bin"), d.keys())
-        bins = {_k: d[_k] for _k in bins_names}
-
         # substitute strings "inf" at start and end of bins with -np.inf and np.inf
-        for k, v in bins.items():
-            b = v.split(',')
-            inf_start = (b[0] == "inf")
-            inf_end = (b[len(b)-1] == "inf")
-            if inf_start:
-                b.pop(0)
-            if inf_end:
-                b.pop(len(b)-1)
-            # convert strings to floats
-            b = list(map(float, b))
-            # add back the inf values
-            if inf_start:
-                b.insert(0, -np.inf)
-            if inf_end:
-                b.insert(len(b), np.inf)
-            bins[k] = b
+        bins = {_k: parse_bins(d[_k]) for _k in bins_names}
 
         # EA OPERATORS
         ea_operators = [func for func in dir(EaOperators)
@@ -218,7 +343,7 @@ class MapElites(ABC):
         if crossover_fun not in ea_operators:
             raise ValueError(f"Crossover operator {crossover_op} not implemented.")
         crossover_fun = getattr(EaOperators, crossover_fun)
-        crossover_args = None
+        crossover_args = dict()
         if crossover_op == "UNIFORM":
             crossover_args = {
                 "indpb": config['crossover'].getfloat('indpb')
@@ -229,12 +354,27 @@ class MapElites(ABC):
             optimization_function=function_class,
             optimization_function_dimensions=function_dimensions,
             bootstrap_individuals=bootstrap_individuals,
+            bootstrap_sampling=bootstrap_sampling,
             mutation_op=mutation_fun,
             mutation_args=mutation_args,
             crossover_flag=crossover_flag,
             crossover_op=crossover_fun,
             crossover_args=crossover_args,
             minimization=minimization,
+            batch_size=batch_size,
+            evaluator=evaluator,
+            steady_state=steady_state,
+            max_in_flight=max_in_flight,
+            archive=archive,
+            checkpoint_every=checkpoint_every,
+            checkpoint_seconds=checkpoint_seconds,
+            log_insertions=log_insertions,
+            profile=profile,
+            profile_interval=profile_interval,
+            ensemble_runs=ensemble_runs,
+            headless=headless,
+            plot_mode=plot_mode,
+            resume=resume,
             plot_args=plot_args,
             log_dir=log_dir,
             config_path=config_path,
@@ -243,52 +383,330 @@ class MapElites(ABC):
             bins=bins
         )
 
+    @classmethod
+    def resume_from_checkpoint(cls, log_dir):
+        """
+        Create a MAP-Elites instance continuing the run checkpointed in a log directory,
+        with the config file saved in that directory.
+        :param log_dir: Path to the logging directory of the run
+        """
+        log_dir = Path(log_dir)
+        state = load_checkpoint(log_dir)
+        instance = cls.from_config(log_dir / 'config.ini', log_dir=log_dir, func=state['function'], resume=True)
+        instance.restore_checkpoint(state)
+        return instance
+
+    def spawn_rng(self, *key):
+        """
+        Independent random generator of a stream of the run, derived from the seed and a key.
+        The same seed and key always give the same stream, whatever the number of workers, the order
+        in which the streams are created or the point from which a run is resumed.
+        :param key: Non-negative integers identifying the stream, e.g. (BATCH_STREAM, first evaluation of the batch)
+        :return: np.random.Generator instance
+        """
+        return np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=key))
+
+    def checkpoint_state(self):
+        """
+        Snapshot of everything needed to continue the run: the map of elites, the counters
+        and the state of the random generators
+        """
+        cells, perfs, X = self.archive.elites()
+        if self.insertion_log is not None:
+            # the records of the checkpoint must be on disk before the checkpoint
+            self.insertion_log.flush()
+        return {
+            'function': self.F.__class__.__name__,
+            'seed': self.seed,
+            'evaluations': self.evaluations,
+            'elapsed_time': time.time() - self.start_time,
+            'cells': cells,
+            'performances': perfs,
+            'solutions': X,
+            'rng_state': self.rng.bit_generator.state,
+            'insertion_records': self.insertion_log.records if self.insertion_log is not None else None
+        }
+
+    def restore_checkpoint(self, state):
+        """
+        Restore the map of elites, the counters and the random generators from a checkpoint state
+        """
+        self.seed = state['seed']
+        self.evaluations = state['evaluations']
+        self.elapsed_time = state['elapsed_time']
+        self.archive.restore(state['cells'], state['performances'], state['solutions'])
+        # the streams of the batches only depend on the seed and on the number of evaluations
+        self.rng.bit_generator.state = state['rng_state']
+        if self.log_insertions:
+            if state.get('insertion_records') is None:
+                raise ValueError("The checkpointed run has no insertion log to resume")
+            self.insertion_log = InsertionLog(self.log_dir_path / INSERTION_LOG_FILE, self.archive.shape,
+                                              self.archive.dimensions, minimization=self.minimization,
+                                              records=state['insertion_records'])
+        self.checkpointer.last_evaluations = self.evaluations
+        self.resumed = True
+        self.logger.info(f"Resumed from checkpoint after {self.evaluations} evaluations, with seed {self.seed}")
+
+    def checkpoint_if_due(self):
+        """
+        Write a checkpoint in the background if enough evaluations or time passed since the last one
+        """
+        if self.checkpointer.due(self.evaluations):
+            with self.timer.phase('checkpoint'):
+                self.checkpointer.save(self.checkpoint_state(), self.evaluations)
+
+    def periodic_tasks(self):
+        """
+        Checkpoint and snapshot of the timings, when due. Called after every placement of the main loop
+        """
+        self.checkpoint_if_due()
+        self.timer.stream_if_due(self.log_dir_path / 'timings.jsonl', evaluations=self.evaluations)
+
     def generate_initial_population(self):
         """
         Bootstrap the algorithm by generating `self.bootstrap_individuals` individuals
-        randomly sampled from a uniform distribution
+        sampled from the domain with `self.bootstrap_sampling`.
+        The whole initial population is generated, evaluated and placed as one batch
         """
         self.logger.info("Generate initial population")
-        for _ in range(0, self.random_solutions):
-            x = self.generate_random_solution()
-            # add solution to elites computing features and performance
-            self.place_in_mapelites(x)
+        n = self.random_solutions
+        with self.timer.phase('random_solution', items=n):
+            X = self.generate_random_solutions(n, rng=self.bootstrap_rng)
+        # the evaluator is not started yet, the population is evaluated in this process
+        with self.timer.phase('evaluation', items=n):
+            perfs, cells, in_range = self.evaluate_solutions(X)
+        self.place_evaluated_batch(X, perfs, cells, in_range)
 
     def run(self):
         """
         Main iteration loop of MAP-Elites
         """
-        start_time = time.time()
-        # start by creating an initial set of random solutions
-        self.generate_initial_population()
+        if self.ensemble_runs > 1:
+            self.run_ensemble()
+            return
+        # a resumed run keeps counting from its elapsed time
+        self.start_time = time.time() - self.elapsed_time
+        # start by creating an initial set of random solutions, a resumed run already has them
+        if not self.resumed:
+            self.generate_initial_population()
 
         # tqdm: progress bar
-        with tqdm(total=self.iterations, desc="Iterations completed") as pbar:
-            for i in range(0, self.iterations):
-                self.logger.debug(f"ITERATION {i}")
-                if self.stopping_criteria():
-                    break
-
-                self.logger.debug("Select and mutate.")
-                # get the number of elements that have already been initialized
-                if self.crossover_flag and \
-                        (np.prod(self.performances.shape) - np.sum(np.isinf(self.performances))) > 1:
-                    inds = self.random_selection(individuals=2)
-                    ind = self.crossover_op(inds[0], inds[1], **self.crossover_args)[0]
-                    ind = self.mutation_op(ind, **self.mutation_args)[0]
-                else:
-                    # get the index of a random individual from the map of elites
-                    ind = self.random_selection(individuals=1)[0]
+        with tqdm(total=self.iterations, initial=self.evaluations, desc="Iterations completed",
+                  disable=not self.progress_bar) as pbar:
+            if self.steady_state or self.batch_size > 1:
+                self.evaluator.start(self)
+                try:
+                    if self.steady_state:
+                        self.run_steady_state(pbar=pbar)
+                    else:
+                        self.run_batches(pbar=pbar)
+                finally:
+                    self.evaluator.close()
+            else:
+                for i in range(self.evaluations, self.iterations):
+                    self.logger.debug("ITERATION %d", i)
+                    if self.stopping_criteria():
+                        break
+
+                    self.logger.debug("Select and mutate.")
+                    # get the number of elements that have already been initialized
+                    if self.crossover_flag and len(self.archive) > 1:
+                        with self.timer.phase('selection', items=2):
+                            inds = self.random_selection(individuals=2)
+                        with self.timer.phase('crossover'):
+                            ind = self.crossover_op(inds[0], inds[1], rng=self.rng, **self.crossover_args)[0]
+                    else:
+                        # get the index of a random individual from the map of elites
+                        with self.timer.phase('selection'):
+                            ind = self.random_selection(individuals=1)[0]
                     # mutate the individual
-                    ind = self.mutation_op(ind, **self.mutation_args)[0]
-                # place the new individual in the map of elites
-                self.place_in_mapelites(ind, pbar=pbar)
+                    with self.timer.phase('mutation'):
+                        ind = self.mutation_op(ind, rng=self.rng, **self.mutation_args)[0]
+                    # place the new individual in the map of elites
+                    self.place_in_mapelites(ind, pbar=pbar)
+                    self.evaluations = i + 1
+                    self.periodic_tasks()
 
         # save results, display metrics and plot statistics
         end_time = time.time()
-        self.elapsed_time = end_time - start_time
+        self.elapsed_time = end_time - self.start_time
+        if self.checkpointer.enabled:
+            # the final checkpoint lets a resumed run end right away
+            self.checkpointer.save(self.checkpoint_state(), self.evaluations, wait=True)
+        self.checkpointer.close()
+        if self.insertion_log is not None:
+            self.insertion_log.close()
         self.save_logs()
-        self.plot_map_of_elites()
+        if not self.headless:
+            self.plot_map_of_elites()
+
+    def run_ensemble(self):
+        """
+        Run `self.ensemble_runs` independent runs together, evaluating the offspring of all the runs
+        in one batch per generation. Each run is saved in its own sub-directory of the log directory
+        (`1` to `ensemble_runs`), heatmaps are not plotted.
+        """
+        self.start_time = time.time()
+        ensemble = Ensemble(self, self.ensemble_runs)
+        self.logger.info(f"Ensemble of {self.ensemble_runs} runs")
+
+        with tqdm(total=self.iterations, desc="Iterations completed (each run)", disable=not self.progress_bar) as pbar:
+            self.evaluator.start(self)
+            try:
+                ensemble.run(pbar=pbar)
+            finally:
+                self.evaluator.close()
+
+        self.elapsed_time = time.time() - self.start_time
+        for r, archive in enumerate(ensemble.archives, 1):
+            best, best_perf = archive.best
+            _, value, solved_constraints = archive.most_promising()
+            self.logger.info(f"Run {r}: best overall value {best_perf},"
+                             f" minimum value solving the highest number of constraints {value}"
+                             f" with {solved_constraints} constraints solved, {len(archive)} cells filled")
+        self.logger.info(f"Running time {time.strftime('%H:%M:%S', time.gmtime(self.elapsed_time))}")
+        ensemble.save(self.log_dir_path)
+        self.timer.dump(self.log_dir_path / 'timings.json', evaluations=self.evaluations * self.ensemble_runs,
+                        bootstrap_evaluations=self.random_solutions * self.ensemble_runs,
+                        elapsed_time=self.elapsed_time)
+        self.ensemble = ensemble
+
+    def run_batches(self, pbar=None):
+        """
+        Batched iteration loop of MAP-Elites.
+        Each generation selects `self.batch_size` parents, generates the offspring,
+        evaluates them together and places them in the map of elites at once.
+        The total number of evaluations is still `self.iterations`.
+        :param pbar: TQDM progress bar instance
+        """
+        while self.evaluations < self.iterations:
+            self.logger.debug("GENERATION starting at iteration %d", self.evaluations)
+            if self.stopping_criteria():
+                break
+            n = min(self.batch_size, self.iterations - self.evaluations)
+            X = self.generate_offspring(n, rng=self.spawn_rng(BATCH_STREAM, self.evaluations))
+            self.place_batch_in_mapelites(X, pbar=pbar)
+            self.evaluations += n
+            self.periodic_tasks()
+
+    def run_steady_state(self, pbar=None):
+        """
+        Asynchronous steady-state iteration loop of MAP-Elites.
+        Keeps up to `self.max_in_flight` batches of `self.batch_size` offspring being evaluated,
+        and places each batch as soon as its evaluation completes. New parents are always
+        selected from the current map of elites, so the workers never wait for the slowest evaluation.
+        The total number of evaluations is still `self.iterations`.
+        The offspring of each batch are drawn from a random stream given by the seed and the position
+        of the batch, but the batches are placed in the order their evaluations complete, so the parents
+        of the following batches, and the run, depend on the timing of the evaluations:
+        a steady-state run is not reproducible from its seed.
+        Checkpoints only count the placed batches, so a resumed run evaluates again
+        the batches that were in flight.
+        :param pbar: TQDM progress bar instance
+        """
+        in_flight = dict()
+        submitted = self.evaluations
+        stop = False
+        while in_flight or (submitted < self.iterations and not stop):
+            # refill the evaluation queue
+            while submitted < self.iterations and len(in_flight) < self.max_in_flight:
+                stop = self.stopping_criteria()
+                if stop:
+                    break
+                n = min(self.batch_size, self.iterations - submitted)
+                X = self.generate_offspring(n, rng=self.spawn_rng(BATCH_STREAM, submitted))
+                in_flight[self.evaluator.submit(X)] = X
+                submitted += n
+            if not in_flight:
+                break
+            with self.timer.phase('wait'):
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                X = in_flight.pop(future)
+                perfs, cells, in_range = future.result()
+                self.place_evaluated_batch(X, perfs, cells, in_range, pbar=pbar)
+                self.evaluations += len(X)
+                self.periodic_tasks()
+
+    def generate_offspring(self, n, archive=None, rng=None):
+        """
+        Select parents from the map of elites and apply crossover (if enabled) and mutation.
+        Each offspring with crossover comes from two distinct elites.
+        :param n: Number of offspring to generate
+        :param archive: Map of elites of the parents, defaults to `self.archive`
+        :param rng: Random generator of the selection and of the operators. Defaults to `self.rng`
+        :return: array of shape (n, D)
+        """
+        archive = archive if archive is not None else self.archive
+        rng = rng if rng is not None else self.rng
+        crossover = self.crossover_flag and len(archive) > 1
+        with self.timer.phase('selection', items=2 * n if crossover else n):
+            filled = archive.filled
+            first = rng.integers(0, len(filled), n)
+            # the archive returns copies of the parents, so the elites in the map are never modified
+            parents = archive.solutions_at(filled[first])
+            if crossover:
+                # draw the second parent among the remaining elites
+                second = rng.integers(0, len(filled) - 1, n)
+                second[second >= first] += 1
+                mates = archive.solutions_at(filled[second])
+        if crossover:
+            with self.timer.phase('crossover', items=n):
+                parents = self.crossover_op(parents, mates, rng=rng, **self.crossover_args)[0]
+        with self.timer.phase('mutation', items=n):
+            return self.mutation_op(parents, rng=rng, **self.mutation_args)[0]
+
+    def evaluate_solutions(self, X):
+        """
+        Compute performance and cells in the feature space of a batch of solutions.
+        This is the unit of work sent to the evaluator, it must not touch the map of elites.
+        :param X: array of shape (N, D) of genotypes
+        :return: array of shape (N,) of performances, array of shape (N,) of flat cell indices
+            and boolean array of shape (N,), False for the solutions outside of the feature space
+        """
+        return (self.performance_measure_batch(X),) + self.map_x_to_b_batch(X)
+
+    def place_batch_in_mapelites(self, X, pbar=None):
+        """
+        Evaluate a batch of solutions with the evaluator and put them inside
+        the N-dimensional map of elites space.
+        :param X: array of shape (N, D) of genotypes
+        :param pbar: TQDM progress bar instance
+        """
+        X = np.asarray(X, dtype=float)
+        # objective and feature descriptors are computed together by the evaluator
+        with self.timer.phase('evaluation', items=len(X)):
+            perfs, cells, in_range = self.evaluator.evaluate(X)
+        self.place_evaluated_batch(X, perfs, cells, in_range, pbar=pbar)
+
+    def place_evaluated_batch(self, X, perfs, cells, in_range=None, pbar=None):
+        """
+        Puts a batch of already evaluated solutions inside the N-dimensional map of elites space.
+        Same criteria as `place_in_mapelites()`, but when several solutions land
+        in the same cell only the best one of them competes with the current elite.
+        :param X: array of shape (N, D) of genotypes
+        :param perfs: array of shape (N,) of performances
+        :param cells: array of shape (N,) of flat cell indices
+        :param in_range: boolean array of shape (N,), False for the solutions outside of the feature space.
+            Those solutions are discarded. None if all the solutions are inside the feature space
+        :param pbar: TQDM progress bar instance
+        """
+        X = np.asarray(X, dtype=float)
+        perfs = np.asarray(perfs, dtype=float)
+        cells = np.asarray(cells)
+        with self.timer.phase('placement', items=len(X)):
+            placed = np.zeros(len(X), dtype=bool)
+            if in_range is not None and not np.all(in_range):
+                self.logger.warning(f"PLACE: {np.sum(~in_range)} individuals outside of the bins discarded")
+                placed[in_range] = self.archive.insert_batch(cells[in_range], perfs[in_range], X[in_range])
+            else:
+                placed = self.archive.insert_batch(cells, perfs, X)
+        if self.insertion_log is not None:
+            with self.timer.phase('insertion_log', items=len(X)):
+                self.insertion_log.write(cells, perfs, X, placed)
+        self.logger.debug("PLACE: %d of %d individuals placed", np.sum(placed), len(X))
+        if pbar is not None:
+            pbar.update(len(X))
 
     def place_in_mapelites(self, x, pbar=None):
         """
@@ -303,90 +721,50 @@ class MapElites(ABC):
         :param x: genotype of an individual
         :param pbar: TQDM progress bar instance
         """
+        # evaluation shared by features and performance, if the subclass computes them together
+        with self.timer.phase('evaluation'):
+            self.evaluate_solution(x)
         # get coordinates in the feature space
-        b = self.map_x_to_b(x)
+        with self.timer.phase('features'):
+            b = self.map_x_to_b(x)
         # performance of the optimization function
-        perf = self.performance_measure(x)
-        # place operator performs either minimization or maximization
-        if self.place_operator(perf, self.performances[b]):
-            self.logger.debug(f"PLACE: Placing individual {x} at {b} with perf: {perf}")
-            self.performances[b] = perf
-            self.solutions[b] = x
+        with self.timer.phase('objective'):
+            perf = self.performance_measure(x)
+        # the archive performs either minimization or maximization
+        with self.timer.phase('placement'):
+            cell = self.archive.cell(b)
+            placed = self.archive.insert(cell, perf, x)
+        if self.insertion_log is not None:
+            with self.timer.phase('insertion_log'):
+                self.insertion_log.write([cell], [perf], [x], [placed])
+        # lazy formatting: the messages are only built if a handler records them
+        if placed:
+            self.logger.debug("PLACE: Placing individual %s at %s with perf: %s", x, b, perf)
         else:
-            self.logger.debug(f"PLACE: Individual {x} rejected at {b} with perf: {perf} in favor of {self.performances[b]}")
+            self.logger.debug("PLACE: Individual %s rejected at %s with perf: %s", x, b, perf)
         if pbar is not None:
             pbar.update(1)
 
-    # TODO: Here we might get stuck in infinite loop in case the map of elites does not have at least `individuals` initialized elements
     def random_selection(self, individuals=1):
         """
-        Select an elite x from the current map of elites.
-        The selection is done by selecting a random bin for each feature
-        dimension, until a bin with a value is found.
+        Select elites x from the current map of elites.
+        The selection draws distinct occupied cells uniformly at random,
+        so it never loops on sparse maps of elites.
         :param individuals: The number of individuals to randomly select
-        :return: A list of N random elites
-        """
-
-        def _get_random_index():
-            """
-            Get a random cell in the N-dimensional feature space
-            :return: N-dimensional tuple of integers
-            """
-            indexes = tuple()
-            for ft in self.feature_dimensions:
-                rnd_ind = np.random.randint(0, len(ft.bins) - 1, 1)[0]
-                indexes = indexes + (rnd_ind,)
-            return indexes
-
-        def _is_not_initialized(index):
-            """
-            Checks if the selected index points to a NaN or Inf solution (not yet initialized)
-            The solution is considered as NaN/Inf if any of the dimensions of the individual is NaN/Inf
-            :return: Boolean
-            """
-            return any([x == np.nan or np.abs(x) == np.inf for x in self.solutions[index]])
-
-
-        # individuals
-        inds = list()
-        idxs = list()
-        for _ in range(0, individuals):
-            idx = _get_random_index()
-            # we do not want to repeat entries
-            while idx in idxs or _is_not_initialized(idx):
-                idx = _get_random_index()
-            idxs.append(idx)
-            inds.append(self.solutions[idx])
-        return inds
+        :return: A list of N random elites. The elites are copies, they can be modified in place.
+        """
+        cells = self.archive.sample(individuals, replace=False, rng=self.rng)
+        return list(self.archive.solutions_at(cells))
 
     def get_most_promising_solution(self):
         """
         Get the value which solve the most number of constraints.
-        We get the minimum from the axis that present no NaN values
-        """
-
-        def _make_index(num_dimension, slice_positions):
-            """
-            Create index with dynamic slicing
-            """
-            zeros = [0] * num_dimension
-            for i in slice_positions:
-                zeros[i] = slice(None)
-            return tuple(zeros)
-
-        def _take_min(indices):
-            return np.array([self.performances[idx].min() for idx in indices]).min()
-
-        d = len(self.performances.shape)
-        # the number of zeros (solved constraints) to use
-        for i in reversed(range(1, d+1)):
-            idx = _make_index(d, list(range(0, d-i)))
-            min_v = _take_min(list(permutations(idx)))
-            if min_v != np.inf:
-                # solution found
-                # return position of most satisfying (constraints) solution with min value
-                return min_v, i
-        return None, None
+        The archive keeps the best elite of each number of solved constraints,
+        see `most_promising_solution()` for the same reduction on saved performances
+        :return: best value and number of solved constraints, (None, None) if no constraint is solved
+        """
+        _, value, solved_constraints = self.archive.most_promising()
+        return value, solved_constraints
 
     def save_logs(self):
         """
@@ -394,29 +772,31 @@ class MapElites(ABC):
         """
 
         best_value, solved_constraints = self.get_most_promising_solution()
-        if best_value:
+        if best_value is not None:
             self.logger.info(f"The minimum value solving the highest number of constraints is"
                              f" {best_value}, with {solved_constraints} constraints solved")
         # save best oveall value and individual
-        if self.minimization:
-            best = self.performances.argmin()
-        else:
-            best = self.performances.argmax()
-        idx = np.unravel_index(best, self.performances.shape)
-        best_perf = self.performances[idx]
-        best_ind = self.solutions[idx]
-        self.logger.info(f"Best overall value: {best_perf}"
-                         f" produced by individual {best_ind}"
-                         f" and placed at {self.map_x_to_b(best_ind)}")
+        best, best_perf = self.archive.best
+        if best is not None:
+            best_ind = self.archive.solutions_at(np.array([best]))[0]
+            self.logger.info(f"Best overall value: {best_perf}"
+                             f" produced by individual {best_ind}"
+                             f" and placed at {self.archive.coordinates(best)}")
+        self.logger.info(f"Elites: {len(self.archive)} of {self.archive.size} cells filled,"
+                         f" QD-score {self.archive.qd_score()}")
         self.logger.info(f"Running time {time.strftime('%H:%M:%S', time.gmtime(self.elapsed_time))}")
 
-        np.save(self.log_dir_path / 'performances', self.performances)
-        np.save(self.log_dir_path / "solutions", self.solutions)
+        self.archive.save(self.log_dir_path)
+        self.timer.dump(self.log_dir_path / 'timings.json', evaluations=self.evaluations,
+                        bootstrap_evaluations=self.random_solutions, elapsed_time=self.elapsed_time)
 
     def plot_map_of_elites(self):
         """
-        Plot a heatmap of elites
+        Plot a heatmap of elites, now or later depending on `plot_mode`
         """
+        if isinstance(self.archive, SparseArchive) and not self.archive.can_densify(self.archive.size):
+            self.logger.warning(f"PLOT: the map of elites has {self.archive.size} cells, too many for a heatmap")
+            return
         # Stringify the bins to be used as strings in the plot axes
         if len(self.feature_dimensions) == 1:
             y_ax = ["-"]
@@ -425,13 +805,53 @@ class MapElites(ABC):
             x_ax = [str(d) for d in self.feature_dimensions[0].bins]
             y_ax = [str(d) for d in self.feature_dimensions[1].bins]
 
+        title = f"{self.F.__class__.__name__} function"
+
+        if self.plot_mode != 'sync':
+            # the map of elites is already saved in the log directory
+            write_heatmap_job(self.log_dir_path, x_ax, y_ax, title, minimization=self.minimization,
+                              highlight_best=self.plot_args.get('highlight_best', True))
+            if self.plot_mode == 'background':
+                spawn_renderer([self.log_dir_path])
+            return
+
+        from .plot_utils import plot_heatmap
         plot_heatmap(self.performances,
                      x_ax,
                      y_ax,
                      savefig_path=self.log_dir_path,
-                     title=f"{self.F.__class__.__name__} function",
+                     title=title,
                      **self.plot_args)
 
+    def __getstate__(self):
+        """
+        Pickle the configuration of the algorithm, used to send it to parallel evaluation workers.
+        The map of elites stays in the parent process and the feature dimensions
+        are rebuilt when unpickling, since they may hold local functions.
+        """
+        state = self.__dict__.copy()
+        for k in ['archive', 'feature_dimensions', 'evaluator', 'checkpointer', 'insertion_log']:
+            state.pop(k, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.feature_dimensions = self.generate_feature_dimensions()
+
+    @property
+    def performances(self):
+        """
+        N-dimensional array of the performances of the elites. Empty cells are inf
+        """
+        return self.archive.performances
+
+    @property
+    def solutions(self):
+        """
+        N-dimensional array of the elites genotypes. Empty cells are inf
+        """
+        return self.archive.solutions
+
     def get_elapsed_time(self):
         return self.elapsed_time
 
@@ -442,6 +862,50 @@ class MapElites(ABC):
         """
         return False
 
+    def evaluate_solution(self, x):
+        """
+        Evaluate a solution before `map_x_to_b()` and `performance_measure()` are called on it.
+        Subclasses computing features and performance with a single evaluation override it
+        and cache the result, so that the evaluation is timed apart from the discretization.
+        By default it does nothing
+        :param x: genotype of a solution
+        """
+        pass
+
+    def performance_measure_batch(self, X):
+        """
+        Evaluate a batch of solutions. Subclasses can override this
+        with a vectorized version, by default it loops over `performance_measure()`
+        :param X: array of shape (N, D) of genotypes
+        :return: array of shape (N,) of performance measures
+        """
+        return np.array([self.performance_measure(x) for x in X], dtype=float)
+
+    def generate_random_solutions(self, n, rng=None):
+        """
+        Generate a batch of initial random solutions. Subclasses can override this
+        with a vectorized version honouring `self.bootstrap_sampling`,
+        by default it loops over `generate_random_solution()`
+        :param n: Number of solutions
+        :param rng: Random generator to draw the solutions from. Defaults to `self.bootstrap_rng`
+        :return: array of shape (n, D)
+        """
+        rng = rng if rng is not None else self.bootstrap_rng
+        return np.array([self.generate_random_solution(rng=rng) for _ in range(n)], dtype=float)
+
+    def map_x_to_b_batch(self, X):
+        """
+        Map a batch of solutions to the feature space. Subclasses can override this
+        with a vectorized version, by default it loops over `map_x_to_b()`
+        :param X: array of shape (N, D) of genotypes
+        :return: array of shape (N,) of flat cell indices and boolean array of shape (N,),
+            False for the solutions outside of the feature space
+        """
+        b = np.array([self.map_x_to_b(x) for x in X], dtype=np.intp).reshape(len(X), -1)
+        # the map of elites is not available in the evaluator workers, so its shape comes from the bins
+        shape = [len(ft.bins) - 1 for ft in self.feature_dimensions]
+        return np.ravel_multi_index(tuple(b.T), shape), np.ones(len(X), dtype=bool)
+
     @abstractmethod
     def performance_measure(self, x):
         """
@@ -461,9 +925,10 @@ class MapElites(ABC):
         pass
 
     @abstractmethod
-    def generate_random_solution(self):
+    def generate_random_solution(self, rng=None):
         """
         Function to generate an initial random solution x
+        :param rng: Random generator to draw the solution from. Defaults to `self.bootstrap_rng`
         :return: x, a random solution
         """
         pass
@@ -3,7 +3,9 @@ import numpy as np
 import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
-import matplotlib.ticker as ticker
+
+# the fast renderer is importable without pandas and seaborn, plot_heatmap_raster is re-exported here
+from .heatmap_raster import heatmap_matrix, set_heatmap_axes, plot_heatmap_raster  # noqa: F401
 
 
 def plot_heatmap(data,
@@ -26,17 +28,7 @@ def plot_heatmap(data,
     # if len(d) == 1 or len(d) == 2:
     #     plot_annotations = True
 
-    # reshape data to obtain a 2d heatmap
-    if len(d) == 1:
-        data = [data]
-    if len(d) == 2:
-        data = data.transpose()
-    if len(d) == 3:
-        data = np.transpose(data, axes=(1, 0, 2)).reshape((d[1], d[0] * d[2]))
-    if len(d) == 4:
-        _data = np.transpose(data, axes=[1, 0, 2, 3])
-        data = np.transpose(_data.reshape((d[1], d[0] * d[2], d[3])), axes=[0, 2, 1]).reshape(
-            (d[1] * d[3], d[0] * d[2]))
+    data = heatmap_matrix(data)
 
     plt.subplots(figsize=(10, 10))
 
@@ -71,60 +63,7 @@ def plot_heatmap(data,
     ax.set_title(title)
     ax.invert_yaxis()
 
-    # set ticks
-    y_ticks_pos = [0.5]
-    x_ticks_pos = range(0, d[0]+1)
-    if len(d) > 1:
-        y_ticks_pos = range(0, d[1]+1)
-    if len(d) > 2:
-        x_ticks_pos = range(0, d[0]*d[2]+1, d[2])
-    if len(d) > 3:
-        y_ticks_pos = range(0, d[1]*d[3]+1, d[3])
-
-    if y_axis[0] == "-inf":
-        y_axis[0] = ""
-    if x_axis[0] == "-inf":
-        x_axis[0] = ""
-    if y_axis[len(y_axis) - 1] == "inf":
-        y_axis[len(y_axis) - 1] = ""
-    if x_axis[len(x_axis) - 1] == "inf":
-        x_axis[len(x_axis) - 1] = ""
-
-    ax.xaxis.set_major_locator(ticker.FixedLocator(x_ticks_pos))
-    ax.xaxis.set_major_formatter(ticker.FixedFormatter(x_axis))
-
-    ax.yaxis.set_major_locator(ticker.FixedLocator(y_ticks_pos))
-    ax.yaxis.set_major_formatter(ticker.FixedFormatter(y_axis))
-
-    # show grid lines
-    thick_grid_color = 'k'
-    thick_grid_width = 2
-    if len(d) == 3:
-        ax.vlines(
-            list(range(0, d[0] * d[2], d[2])),
-            *ax.get_ylim(),
-            colors=thick_grid_color,
-            linewidths=thick_grid_width
-        )
-        ax.hlines(
-            list(range(0, d[1])),
-            *ax.get_xlim(),
-            colors=thick_grid_color,
-            linewidths=thick_grid_width
-        )
-    if len(d) == 4:
-        ax.vlines(
-            list(range(0, d[0] * d[2] + 1, d[2])),
-            *ax.get_ylim(),
-            colors=thick_grid_color,
-            linewidths=thick_grid_width
-        )
-        ax.hlines(
-            list(range(0, d[1] * d[3] + 1, d[3])),
-            *ax.get_xlim(),
-            colors=thick_grid_color,
-            linewidths=thick_grid_width
-        )
+    set_heatmap_axes(ax, d, x_axis, y_axis)
 
     # get figure to save to file
     if savefig_path:
@@ -0,0 +1,120 @@
+import json
+import time
+
+from pathlib import Path
+
+
+class _Phase:
+    """
+    Context manager adding the time spent in its block to a phase of a PhaseTimer
+    """
+    __slots__ = ['stats', 'items', 'start']
+
+    def __init__(self, stats):
+        self.stats = stats
+        self.items = 1
+        self.start = 0.
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.stats[0] += time.perf_counter() - self.start
+        self.stats[1] += 1
+        self.stats[2] += self.items
+
+
+class _NoPhase:
+    """
+    Context manager doing nothing, used when profiling is disabled
+    """
+    __slots__ = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NO_PHASE = _NoPhase()
+
+
+class PhaseTimer:
+    """
+    Low-overhead wall-clock timers and counters of the phases of the MAP-Elites loop.
+    Each phase accumulates its time, its number of calls and its number of items
+    (e.g. the individuals selected or evaluated by a call).
+
+        with timer.phase('mutation', items=len(X)):
+            ...
+    """
+
+    def __init__(self, enabled=True, interval=0):
+        """
+        :param enabled: False to make all the phases no-ops
+        :param interval: Seconds between two snapshots written by `stream_if_due()`. 0 to disable
+        """
+        self.enabled = enabled
+        self.interval = interval
+        # phase name: [seconds, calls, items]
+        self.stats = dict()
+        self._phases = dict()
+        self._start_time = time.perf_counter()
+        self._last_stream = self._start_time
+
+    def phase(self, name, items=1):
+        """
+        Context manager timing a block of code as one call of a phase
+        :param name: Name of the phase
+        :param items: Number of items processed by the block
+        """
+        if not self.enabled:
+            return _NO_PHASE
+        phase = self._phases.get(name)
+        if phase is None:
+            self.stats[name] = [0., 0, 0]
+            phase = self._phases[name] = _Phase(self.stats[name])
+        phase.items = items
+        return phase
+
+    def summary(self, **extra):
+        """
+        Statistics of all the phases
+        :param extra: Additional values to report, e.g. the number of evaluations
+        :return: dict with the wall-clock time since the timer creation and, for each phase,
+            its total seconds, calls, items, share of the wall-clock time and microseconds per item
+        """
+        wall = time.perf_counter() - self._start_time
+        phases = {name: {'seconds': seconds,
+                         'calls': calls,
+                         'items': items,
+                         'share': seconds / wall if wall > 0 else 0.,
+                         'us_per_item': 1e6 * seconds / items if items > 0 else 0.}
+                  for name, (seconds, calls, items) in self.stats.items()}
+        return dict(wall_seconds=wall, **extra, phases=phases)
+
+    def dump(self, path, **extra):
+        """
+        Write the summary as a JSON file
+        :param path: Path of the JSON file
+        :param extra: Additional values to report
+        """
+        if self.enabled:
+            with open(path, 'w') as f:
+                json.dump(self.summary(**extra), f, indent=2)
+
+    def stream_if_due(self, path, **extra):
+        """
+        Append the summary as one line of a JSON lines file, if `interval` seconds passed since the last one
+        :param path: Path of the JSON lines file
+        :param extra: Additional values to report
+        """
+        if not self.enabled or self.interval <= 0:
+            return
+        now = time.perf_counter()
+        if now - self._last_stream >= self.interval:
+            self._last_stream = now
+            with open(Path(path), 'a') as f:
+                f.write(json.dumps(self.summary(**extra)) + '\n')
@@ -0,0 +1,152 @@
+import numpy as np
+
+
+# Sobol direction numbers of dimensions 2 to 30 (Joe and Kuo, new-joe-kuo-6.21201):
+# degree s of the primitive polynomial, its coefficients a and the initial direction numbers m_1..m_s.
+# The first dimension uses m_i = 1 (van der Corput sequence)
+SOBOL_DIRECTIONS = [
+    (1, 0, [1]),
+    (2, 1, [1, 3]),
+    (3, 1, [1, 3, 1]),
+    (3, 2, [1, 1, 1]),
+    (4, 1, [1, 1, 3, 3]),
+    (4, 4, [1, 3, 5, 13]),
+    (5, 2, [1, 1, 5, 5, 17]),
+    (5, 4, [1, 1, 5, 5, 5]),
+    (5, 7, [1, 1, 7, 11, 19]),
+    (5, 11, [1, 1, 5, 1, 1]),
+    (5, 13, [1, 1, 1, 3, 11]),
+    (5, 14, [1, 3, 5, 5, 31]),
+    (6, 1, [1, 3, 3, 9, 7, 49]),
+    (6, 13, [1, 1, 1, 15, 21, 21]),
+    (6, 16, [1, 3, 1, 13, 27, 49]),
+    (6, 19, [1, 1, 1, 15, 7, 5]),
+    (6, 22, [1, 3, 1, 15, 13, 25]),
+    (6, 25, [1, 1, 5, 5, 19, 61]),
+    (7, 1, [1, 3, 7, 11, 23, 15, 103]),
+    (7, 4, [1, 3, 7, 13, 13, 15, 69]),
+    (7, 7, [1, 1, 3, 13, 7, 35, 63]),
+    (7, 8, [1, 3, 5, 9, 1, 25, 53]),
+    (7, 14, [1, 3, 1, 13, 9, 35, 107]),
+    (7, 19, [1, 3, 1, 5, 27, 61, 31]),
+    (7, 21, [1, 1, 5, 11, 19, 41, 61]),
+    (7, 28, [1, 3, 5, 3, 3, 13, 69]),
+    (7, 31, [1, 1, 7, 13, 1, 19, 1]),
+    (7, 32, [1, 3, 7, 5, 13, 19, 59]),
+    (7, 37, [1, 1, 3, 9, 25, 29, 41]),
+]
+# bits of the Sobol points
+SOBOL_BITS = 32
+
+
+def _primes(n):
+    """
+    First n prime numbers
+    """
+    primes = list()
+    candidate = 2
+    while len(primes) < n:
+        if all(candidate % p for p in primes if p * p <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def _sobol_directions(dimensions):
+    """
+    Direction numbers of the Sobol sequence, as integers of SOBOL_BITS bits
+    :return: array of shape (dimensions, SOBOL_BITS)
+    """
+    if dimensions > len(SOBOL_DIRECTIONS) + 1:
+        raise ValueError(f"Sobol sampling supports up to {len(SOBOL_DIRECTIONS) + 1} dimensions, got {dimensions}")
+    V = np.zeros((dimensions, SOBOL_BITS), dtype=np.uint64)
+    # first dimension: m_i = 1
+    V[0] = 1 << np.arange(SOBOL_BITS - 1, -1, -1, dtype=np.uint64)
+    for j, (s, a, m) in enumerate(SOBOL_DIRECTIONS[:dimensions - 1], 1):
+        m = list(m)
+        # recurrence of the direction numbers on the coefficients of the primitive polynomial
+        for i in range(s, SOBOL_BITS):
+            value = m[i - s] ^ (m[i - s] << s)
+            for k in range(1, s):
+                if (a >> (s - 1 - k)) & 1:
+                    value ^= m[i - k] << k
+            m.append(value)
+        V[j] = [m_i << (SOBOL_BITS - 1 - i) for i, m_i in enumerate(m[:SOBOL_BITS])]
+    return V
+
+
+def uniform_sample(n, dimensions, rng):
+    """
+    Independent uniform samples of the unit hypercube
+    :param n: Number of samples
+    :param dimensions: Number of dimensions
+    :param rng: Random generator
+    :return: array of shape (n, dimensions) in [0, 1)
+    """
+    return rng.random((n, dimensions))
+
+
+def latin_hypercube_sample(n, dimensions, rng):
+    """
+    Latin hypercube samples of the unit hypercube: along every dimension,
+    each of the n equal intervals contains exactly one sample
+    """
+    strata = rng.permuted(np.tile(np.arange(n), (dimensions, 1)), axis=1).T
+    return (strata + rng.random((n, dimensions))) / n
+
+
+def sobol_sample(n, dimensions, rng):
+    """
+    Scrambled Sobol samples of the unit hypercube, with a random linear matrix scramble
+    and a random digital shift of every dimension. The balance properties of the sequence
+    hold for n equal to a power of 2
+    """
+    V = _sobol_directions(dimensions)
+    # linear matrix scramble: random lower triangular binary matrix with unit diagonal, one per dimension
+    L = np.tril(rng.integers(0, 2, (dimensions, SOBOL_BITS, SOBOL_BITS), dtype=np.uint64), -1)
+    L += np.eye(SOBOL_BITS, dtype=np.uint64)
+    # bits of the direction numbers, from the most significant one
+    shifts = np.arange(SOBOL_BITS - 1, -1, -1, dtype=np.uint64)
+    bits = (V[:, :, None] >> shifts) & np.uint64(1)
+    bits = np.einsum('dkl,djl->djk', L, bits) & np.uint64(1)
+    V = np.sum(bits << shifts, axis=2, dtype=np.uint64)
+
+    # point i is the xor of the direction numbers selected by the bits of its Gray code
+    gray = np.arange(n, dtype=np.uint64)
+    gray ^= gray >> np.uint64(1)
+    X = np.zeros((n, dimensions), dtype=np.uint64)
+    for j in range(SOBOL_BITS):
+        X ^= ((gray >> np.uint64(j)) & np.uint64(1))[:, None] * V[:, j]
+    X ^= rng.integers(0, 1 << SOBOL_BITS, dimensions, dtype=np.uint64)
+    return X / float(1 << SOBOL_BITS)
+
+
+def halton_sample(n, dimensions, rng):
+    """
+    Scrambled Halton samples of the unit hypercube: the radical inverse of the sample index
+    in the base of the i-th prime number, with an independent random permutation of the digits
+    of every position, which breaks the correlations between the dimensions with large bases
+    """
+    X = np.empty((n, dimensions))
+    index = np.arange(n)
+    for j, base in enumerate(_primes(dimensions)):
+        # digits up to the precision of a double
+        digits = int(np.ceil(53 / np.log2(base)))
+        permutations = rng.permuted(np.tile(np.arange(base), (digits, 1)), axis=1)
+        value = np.zeros(n)
+        remainder = index.copy()
+        scale = 1. / base
+        for k in range(digits):
+            value += permutations[k][remainder % base] * scale
+            remainder //= base
+            scale /= base
+        X[:, j] = value
+    return X
+
+
+SAMPLERS = {
+    'uniform': uniform_sample,
+    'lhs': latin_hypercube_sample,
+    'sobol': sobol_sample,
+    'halton': halton_sample
+}
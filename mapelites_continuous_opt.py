@@ -6,47 +6,119 @@ from datetime import datetime
 
 # local imports
 from map_elites.mapelites import MapElites
-from map_elites.feature_dimension import FeatureDimension
+from map_elites.feature_dimension import FeatureDimension, discretize_batch
+from map_elites.sampling import SAMPLERS
 
 
 class MapElitesContinuousOpt(MapElites):
 
     def __init__(self, *args, **kwargs):
+        # last genotype evaluated by evaluate_all() and its result
+        self._last_x = None
+        self._last_evaluation = None
         super(MapElitesContinuousOpt, self).__init__(*args, **kwargs)
 
+    def evaluate_all(self, x):
+        """
+        Compute objective, constraint values and targets of x with a single call to the function.
+        The result is reused by `map_x_to_b()` and `performance_measure()` of the same solution
+        :return: objective value, array of constraint values and array of constraint targets
+        """
+        if self._last_x is None or not np.array_equal(self._last_x, x):
+            self._last_x = np.array(x, dtype=float)
+            self._last_evaluation = self.F.evaluate_all(self._last_x)
+        return self._last_evaluation
+
+    def evaluate_solution(self, x):
+        """
+        Evaluate objective and constraints of x, the features and the performance
+        of x are then computed from the cached result
+        """
+        self.evaluate_all(x)
+
     def map_x_to_b(self, x):
         """
         Map X solution to feature space dimension, meaning:
             - apply the constraints to a solution
         :return: tuple of indexes
         """
-        b = tuple()
-        for ft in self.feature_dimensions:
-            desc = ft.feature_descriptor(x)
-            i = ft.discretize(desc)
-            b = b + (i,)
+        _, values, targets = self.evaluate_all(x)
+        # constraint values follow the order of the feature dimensions
+        return tuple(ft.discretize(ft.feature_descriptor_value(v, t))
+                     for ft, v, t in zip(self.feature_dimensions, values, targets))
 
-        return b
+    def map_x_to_b_batch(self, X):
+        """
+        Map a batch of solutions to the feature space dimensions,
+        computing all the constraints of all the solutions at once
+        :return: array of shape (N,) of flat cell indices and boolean array of shape (N,),
+            False for the solutions outside of the bins
+        """
+        return self._discretize_constraints(self.F.constraints_batch(X), self.F.targets_batch(X))
+
+    def _discretize_constraints(self, values, targets):
+        """
+        Compute the cells in the feature space from constraint values and targets
+        :param values: array of shape (N, number of constraints) of constraint values
+        :param targets: array of shape (N, number of constraints) of constraint targets
+        :return: array of shape (N,) of flat cell indices and boolean array of shape (N,),
+            False for the solutions outside of the bins
+        """
+        # columns of the constraints follow the order of the feature dimensions
+        descriptors = np.empty(values.shape)
+        for j, ft in enumerate(self.feature_dimensions):
+            descriptors[:, j] = ft.feature_descriptor_batch(values[:, j], targets[:, j])
+        return discretize_batch(self.feature_dimensions, descriptors)
+
+    def evaluate_solutions(self, X):
+        """
+        Compute performance and cells in the feature space of a batch of solutions
+        with a single call to the function
+        """
+        perfs, values, targets = self.F.evaluate_all_batch(X)
+        return (perfs,) + self._discretize_constraints(values, targets)
 
     def performance_measure(self, x):
         """
         Apply the fitness continuous function to x
         """
         self.logger.debug("calculate performance measure")
-        return self.F.evaluate(x)
+        return self.evaluate_all(x)[0]
+
+    def performance_measure_batch(self, X):
+        """
+        Apply the fitness continuous function to a batch of solutions
+        """
+        self.logger.debug("calculate batch performance measure")
+        return self.F.evaluate_batch(X)
 
-    def generate_random_solution(self):
+    def generate_random_solution(self, rng=None):
         """
         To ease the bootstrap of the algorithm, we can generate
         the first solutions in the feature space, so that we start
         filling the bins
+        :param rng: Random generator, defaults to `self.bootstrap_rng`
         """
         self.logger.debug("Generate random solution")
 
-        dimensions = self.F.get_domain()
-        return np.array([
-            np.random.uniform(d[0], d[1], 1)[0] for d in dimensions
-        ])
+        rng = rng if rng is not None else self.bootstrap_rng
+        domain = np.asarray(self.F.get_domain(), dtype=float)
+        return rng.uniform(domain[:, 0], domain[:, 1])
+
+    def generate_random_solutions(self, n, rng=None):
+        """
+        Generate a batch of solutions distributed in the domain of the function
+        with the sampling method `self.bootstrap_sampling`
+        :param n: Number of solutions
+        :param rng: Random generator, defaults to `self.bootstrap_rng`
+        :return: array of shape (n, D)
+        """
+        rng = rng if rng is not None else self.bootstrap_rng
+        domain = np.asarray(self.F.get_domain(), dtype=float)
+        if self.bootstrap_sampling == 'uniform':
+            return rng.uniform(domain[:, 0], domain[:, 1], size=(n, len(domain)))
+        U = SAMPLERS[self.bootstrap_sampling](n, len(domain), rng)
+        return domain[:, 0] + U * (domain[:, 1] - domain[:, 0])
 
     def generate_feature_dimensions(self):
 
@@ -81,9 +153,21 @@ def main():
     parser.add_argument('--conf', type=str, help='Absolute path to conf file')
     parser.add_argument('--logdir', type=str, help='Absolute path to log directory')
     parser.add_argument('--overwrite', action='store_true')
+    parser.add_argument('--resume', type=str, help='Log directory of a checkpointed run to continue')
+    parser.add_argument('--headless', action='store_true', default=None,
+                        help='Do not plot the heatmap at the end of the run (overrides the config file)')
 
     args = parser.parse_args()
 
+    if args.resume:
+        print(f"\tResuming run in log dir: {args.resume}")
+        map_E = MapElitesContinuousOpt.resume_from_checkpoint(args.resume)
+        if args.headless:
+            map_E.headless = True
+        map_E.run()
+        print(f"Running time {time.strftime('%H:%M:%S', time.gmtime(map_E.get_elapsed_time()))}")
+        return
+
     # path to configuration file
     if 'conf' in args:
         config_path = args.conf
@@ -95,7 +179,8 @@ def main():
     map_E = MapElitesContinuousOpt.from_config(config_path,
                                                log_dir=args.logdir,
                                                func=args.func,
-                                               overwrite=args.overwrite)
+                                               overwrite=args.overwrite,
+                                               headless=args.headless)
     map_E.run()
     print(f"Running time {time.strftime('%H:%M:%S', time.gmtime(map_E.get_elapsed_time()))}")
 
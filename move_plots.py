@@ -2,12 +2,7 @@ import os
 import shutil
 from pathlib import Path
 
-
-def listdir_nohidden(path):
-    for f in os.listdir(path):
-        if not f.startswith('.'):
-            yield f
-            
+from map_elites.file_utils import listdir_nohidden
 
 root_log = Path('log/complete_logs/run_10D_standard')
 for ld in listdir_nohidden(root_log):
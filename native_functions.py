@@ -0,0 +1,198 @@
+import os
+import ctypes
+import subprocess
+import tempfile
+
+from pathlib import Path
+
+import numpy as np
+
+import functions
+
+# ====================================================================================================
+# Native backend of the CEC 2010 functions, using the reference C implementation in utils/fcnsuite.c
+# It computes the same values as functions.py, see tests/test_native_functions.py
+# ====================================================================================================
+
+UTILS_DIR = Path(__file__).resolve().parent / 'utils'
+SOURCES = [UTILS_DIR / 'fcnsuite.c', UTILS_DIR / 'fcnsuite_batch.c']
+# path of the shared library can be overridden, e.g. to use a prebuilt one
+LIBRARY_PATH = Path(os.environ.get('FCNSUITE_LIB', UTILS_DIR / 'fcnsuite.so'))
+# functions with a rotation matrix, which the C implementation only defines for 10 and 30 dimensions
+ROTATED_FUNCTIONS = (6, 8, 10, 11, 15)
+
+_lib = None
+
+
+def build_library(path=LIBRARY_PATH):
+    """
+    Compile the C test function suite into a shared library.
+    The library is written to a temporary file and then moved in place, so that
+    concurrent runs never load a partially written file.
+    :param path: Path of the shared library
+    """
+    compiler = os.environ.get('CC', 'cc')
+    fd, tmp_path = tempfile.mkstemp(suffix='.so', dir=path.parent)
+    os.close(fd)
+    try:
+        subprocess.run([compiler, '-O2', '-shared', '-fPIC', '-o', tmp_path, str(UTILS_DIR / 'fcnsuite_batch.c'), '-lm'],
+                       check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        os.replace(tmp_path, path)
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Failed to compile the native CEC 2010 functions: {e.stderr.decode()}")
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_library():
+    """
+    Load the shared library of the C test function suite, compiling it first
+    if it does not exist or it is older than the sources
+    """
+    global _lib
+    if _lib is None:
+        if not LIBRARY_PATH.is_file() or \
+                LIBRARY_PATH.stat().st_mtime < max(s.stat().st_mtime for s in SOURCES):
+            build_library()
+        lib = ctypes.CDLL(str(LIBRARY_PATH))
+        c_double_p = ctypes.POINTER(ctypes.c_double)
+        lib.CEC_batch.argtypes = [ctypes.c_int, c_double_p, c_double_p, c_double_p, c_double_p,
+                                  ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int]
+        lib.CEC_batch.restype = ctypes.c_int
+        _lib = lib
+    return _lib
+
+
+def _pointer(a):
+    return a.ctypes.data_as(ctypes.POINTER(ctypes.c_double))
+
+
+class NativeFunction:
+    """
+    Mixin replacing the evaluation of a CEC 2010 function of functions.py with the C implementation.
+    Domain, constraints names and operators are taken from the python class.
+    """
+
+    def __init__(self, dimensions):
+        super().__init__(dimensions)
+        self.fn = int(self.__class__.__name__[1:])
+        if self.fn in ROTATED_FUNCTIONS and dimensions not in (10, 30):
+            raise ValueError(f"Dimensions must be 10 or 30 for function {self.__class__.__name__}")
+        names = list(super().constraints().keys())
+        self.ng = sum(1 for n in names if n.startswith('g'))
+        self.nh = sum(1 for n in names if n.startswith('h'))
+        # column of each constraint in the [g, h] output of the C functions
+        self.constraint_columns = [int(n[1:]) - 1 + (self.ng if n.startswith('h') else 0) for n in names]
+        load_library()
+
+    def _evaluate_native(self, X):
+        """
+        Evaluate objective and constraints of a batch with one call to the shared library
+        :param X: array of shape (N, D)
+        :return: objective values of shape (N,) and constraint values of shape (N, ng + nh)
+        """
+        # no copy if X is already a contiguous float64 array
+        X = np.ascontiguousarray(np.atleast_2d(X), dtype=np.float64)
+        n = len(X)
+        f = np.empty(n)
+        g = np.empty((n, self.ng))
+        h = np.empty((n, self.nh))
+        # the library is loaded again in the processes where the function is unpickled (e.g. with `spawn`)
+        lib = load_library()
+        lib.CEC_batch(self.fn, _pointer(X), _pointer(f), _pointer(g), _pointer(h), n, self.D, self.ng, self.nh)
+        return f, np.hstack((g, h))
+
+    def evaluate(self, X):
+        return self._evaluate_native(X)[0][0]
+
+    def evaluate_batch(self, X):
+        return self._evaluate_native(X)[0]
+
+    def constraints_batch(self, X):
+        return self._evaluate_native(X)[1][:, self.constraint_columns]
+
+    def evaluate_all_batch(self, X):
+        f, g = self._evaluate_native(X)
+        return f, g[:, self.constraint_columns], self.targets_batch(X)
+
+    def constraints(self):
+        def _native_constraint(column):
+            return lambda x: self._evaluate_native(x)[1][0, column]
+
+        constraints = super().constraints()
+        for c, column in zip(constraints.values(), self.constraint_columns):
+            c['func'] = _native_constraint(column)
+        return constraints
+
+
+class C01(NativeFunction, functions.C01):
+    pass
+
+
+class C02(NativeFunction, functions.C02):
+    pass
+
+
+class C03(NativeFunction, functions.C03):
+    pass
+
+
+class C04(NativeFunction, functions.C04):
+    pass
+
+
+class C05(NativeFunction, functions.C05):
+    pass
+
+
+class C06(NativeFunction, functions.C06):
+    pass
+
+
+class C07(NativeFunction, functions.C07):
+    pass
+
+
+class C08(NativeFunction, functions.C08):
+    pass
+
+
+class C09(NativeFunction, functions.C09):
+    pass
+
+
+class C10(NativeFunction, functions.C10):
+    pass
+
+
+class C11(NativeFunction, functions.C11):
+    pass
+
+
+class C12(NativeFunction, functions.C12):
+    pass
+
+
+class C13(NativeFunction, functions.C13):
+    pass
+
+
+class C14(NativeFunction, functions.C14):
+    pass
+
+
+class C15(NativeFunction, functions.C15):
+    pass
+
+
+class C16(NativeFunction, functions.C16):
+    pass
+
+
+class C17(NativeFunction, functions.C17):
+    pass
+
+
+class C18(NativeFunction, functions.C18):
+    pass
@@ -26,6 +26,10 @@ do
         shift # past argument
         shift # past value
         ;;
+        --headless)
+        HEADLESS="--headless"
+        shift # past argument
+        ;;
 #        --default)
 #        DEFAULT=YES
 #        shift # past argument
@@ -42,6 +46,6 @@ for i in $(seq 1 ${RUNS})
 do
     echo Run ${i}
     mkdir -p ${LOGDIR}
-    python mapelites_continuous_opt.py --conf ${CONFIGFILE} --logdir ${LOGDIR}/${i} --func ${FUNC}
+    python mapelites_continuous_opt.py --conf ${CONFIGFILE} --logdir ${LOGDIR}/${i} --func ${FUNC} ${HEADLESS}
     echo
 done
\ No newline at end of file
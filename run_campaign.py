@@ -0,0 +1,322 @@
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import itertools
+import multiprocessing
+import tempfile
+import traceback
+import configparser
+
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+
+
+# ====================================================================================================
+# Campaign of MAP-Elites runs over a grid of functions, seeds and config overrides, scheduled on a pool
+# of worker processes. Replaces launch_experiments.sh + run.sh: the workers import the modules once and
+# run many experiments each, completed runs are skipped, failed runs are retried (resuming from their
+# last checkpoint, if any) and the state of the campaign is written to a manifest.
+#
+# Runs are logged in {logdir}/{function}/{run} (or {logdir}/{overrides}/{function}/{run} with a grid
+# of config overrides), the same layout used by generate_heatmaps.py and aggregate.py
+# ====================================================================================================
+
+CEC_FUNCTIONS = [f"C{i:02d}" for i in range(1, 19)]
+MANIFEST_FILE = 'campaign.json'
+# written in the log directory of a run once it completed
+RESULT_FILE = 'result.json'
+
+
+# queue where the workers of the current pool announce the runs they start, see `_start_experiment()`
+_started = None
+
+
+def _init_worker(started):
+    """
+    Process pool initializer: import the modules once per worker and disable interactive plots
+    :param started: multiprocessing.SimpleQueue receiving the log directory of every run started by the worker
+    """
+    global _started
+    _started = started
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    import mapelites_continuous_opt  # noqa: F401
+
+
+def _start_experiment(spec):
+    """
+    Announce a run to the campaign and execute it. The SimpleQueue writes to its pipe
+    before returning, so the run is known as started even if its worker dies right after
+    """
+    _started.put(spec['log_dir'])
+    return run_experiment(spec)
+
+
+def run_experiment(spec):
+    """
+    Execute one run of a campaign, resuming it from its checkpoint if a previous attempt left one
+    :param spec: dict with the config file, function, seed, config overrides and log directory of the run
+    :return: dict with the results of the run
+    """
+    from mapelites_continuous_opt import MapElitesContinuousOpt
+    from map_elites.checkpoint import CHECKPOINT_FILE
+
+    log_dir = Path(spec['log_dir'])
+    logger = logging.getLogger('map_elites')
+    try:
+        if (log_dir / CHECKPOINT_FILE).is_file():
+            map_E = MapElitesContinuousOpt.resume_from_checkpoint(log_dir)
+        else:
+            config = configparser.ConfigParser()
+            config.read(spec['config'])
+            for key, value in spec['overrides'].items():
+                section, option = key.split('.', 1)
+                config[section][option] = str(value)
+            config['mapelites']['seed'] = str(spec['seed'])
+            config['mapelites']['interactive'] = 'False'
+            # the config file is copied in the log directory by MapElites
+            with tempfile.NamedTemporaryFile('w', suffix='.ini', delete=False) as f:
+                config.write(f)
+            try:
+                map_E = MapElitesContinuousOpt.from_config(f.name, log_dir=log_dir, func=spec['function'],
+                                                           overwrite=True)
+            finally:
+                os.remove(f.name)
+        # the workers share the stderr of the campaign
+        map_E.progress_bar = False
+        map_E.run()
+
+        best_cell, best_value = map_E.archive.best
+        _, promising_value, solved_constraints = map_E.archive.most_promising()
+        result = {
+            'best_value': best_value,
+            'best_cell': map_E.archive.coordinates(best_cell) if best_cell is not None else None,
+            'most_promising_value': promising_value,
+            'solved_constraints': solved_constraints,
+            'filled_cells': len(map_E.archive),
+            'elapsed_time': map_E.get_elapsed_time()
+        }
+        with open(log_dir / RESULT_FILE, 'w') as f:
+            json.dump(result, f, indent=2)
+        return result
+    finally:
+        # the logger is shared by the runs of a worker: detach the log file of this run
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
+
+
+def make_grid(config_path, log_dir, functions, seeds, overrides):
+    """
+    Expand the campaign grid into the list of runs
+    :param config_path: Path of the base config file
+    :param log_dir: Root log directory of the campaign
+    :param functions: Names of the optimization functions
+    :param seeds: Seeds of the runs of each function, run i uses seeds[i - 1]
+    :param overrides: dict `section.option` -> list of values, the grid is their cartesian product
+    :return: list of run specs
+    """
+    keys = sorted(overrides.keys())
+    runs = list()
+    for values in itertools.product(*[overrides[k] for k in keys]):
+        override = dict(zip(keys, values))
+        experiment_dir = Path(log_dir)
+        if override:
+            experiment_dir = experiment_dir / ",".join(f"{k.split('.', 1)[1]}={v}" for k, v in override.items())
+        for function in functions:
+            for i, seed in enumerate(seeds, 1):
+                runs.append({
+                    'config': str(config_path),
+                    'function': function,
+                    'run': i,
+                    'seed': seed,
+                    'overrides': override,
+                    'log_dir': str(experiment_dir / function / str(i))
+                })
+    return runs
+
+
+def write_manifest(path, manifest):
+    """
+    Atomically write the campaign manifest
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def run_campaign(runs, log_dir, workers=None, retries=1):
+    """
+    Execute the runs of a campaign on a process pool.
+    Runs with a result file are skipped, failed runs are retried up to `retries` times.
+    At most `workers` runs are submitted to the pool at a time. If a worker dies, the pool is replaced:
+    the runs that had not started yet are submitted again as usual, while the ones that had started become
+    suspects. Suspects are retried before the other runs, half of them at a time, until the one that killed
+    its worker runs alone: only a run that kills its worker while running alone counts it as a failed attempt,
+    and it is retried alone.
+    The manifest in the log directory is updated every time a run ends.
+    :param runs: list of run specs, see `make_grid()`
+    :param log_dir: Root log directory of the campaign
+    :param workers: Number of worker processes. None or 0 to use all the available cores
+    :param retries: Number of retries of a failed run
+    :return: the manifest, with the status of every run
+    """
+    log_dir = Path(log_dir)
+    log_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = log_dir / MANIFEST_FILE
+    manifest = {'started': datetime.now().isoformat(), 'runs': runs}
+
+    pending = list()
+    for spec in runs:
+        spec['attempts'] = 0
+        result_path = Path(spec['log_dir']) / RESULT_FILE
+        if result_path.is_file():
+            spec['status'] = 'skipped'
+            with open(result_path) as f:
+                spec['result'] = json.load(f)
+        else:
+            spec['status'] = 'pending'
+            pending.append(spec)
+    write_manifest(manifest_path, manifest)
+
+    workers = workers or os.cpu_count() or 1
+    print(f"\tCampaign of {len(runs)} runs: {len(runs) - len(pending)} already done, "
+          f"{len(pending)} to run on {workers} workers")
+
+    def _submit(spec):
+        spec['attempts'] += 1
+        spec['status'] = 'running'
+        spec['submitted'] = time.time()
+        return executor.submit(_start_experiment, {k: spec[k] for k in
+                                                   ['config', 'function', 'seed', 'overrides', 'log_dir']})
+
+    def _new_pool():
+        started = multiprocessing.SimpleQueue()
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(started,)), started
+
+    def _drain(started):
+        log_dirs = set()
+        while not started.empty():
+            log_dirs.add(started.get())
+        return log_dirs
+
+    def _failed(spec):
+        if spec['attempts'] <= retries:
+            spec['status'] = 'pending'
+            queue.append(spec)
+        else:
+            spec['status'] = 'failed'
+
+    executor, started = _new_pool()
+    try:
+        in_flight = dict()
+        queue = list(pending)
+        # runs of a pool broken by the death of a worker (e.g. segfault or killed by the OS)
+        lost = list()
+        # runs started in a pool broken with other started runs, retried in halves to find the one that killed its worker
+        suspects = list()
+        while in_flight or queue or suspects or lost:
+            if lost and not in_flight:
+                started_dirs = _drain(started)
+                executor.shutdown(cancel_futures=True)
+                executor, started = _new_pool()
+                ran = [spec for spec in lost if spec['log_dir'] in started_dirs]
+                # the runs still waiting for a worker are submitted again, in their original order
+                waiting = [spec for spec in lost if spec['log_dir'] not in started_dirs]
+                for spec in waiting:
+                    spec['attempts'] -= 1
+                queue[:0] = waiting
+                if len(ran) > 1:
+                    for spec in ran:
+                        spec['attempts'] -= 1
+                    suspects.extend(ran)
+                elif ran:
+                    spec = ran[0]
+                    _failed(spec)
+                    if spec['status'] == 'pending':
+                        # retried alone, it would break the pool of the other runs again
+                        queue.remove(spec)
+                        suspects.insert(0, spec)
+                    print(f"\t{spec['function']} run {spec['run']} {spec['log_dir']}: {spec['status']}")
+                lost.clear()
+            if not lost:
+                if suspects:
+                    if not in_flight:
+                        group = suspects[:(len(suspects) + 1) // 2]
+                        del suspects[:len(group)]
+                        for spec in group:
+                            in_flight[_submit(spec)] = spec
+                else:
+                    while queue and len(in_flight) < workers:
+                        spec = queue.pop(0)
+                        in_flight[_submit(spec)] = spec
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                spec = in_flight.pop(future)
+                spec['wall_time'] = time.time() - spec.pop('submitted')
+                try:
+                    spec['result'] = future.result()
+                    spec['status'] = 'done'
+                    spec.pop('error', None)
+                except BrokenProcessPool:
+                    spec['error'] = traceback.format_exc()
+                    spec['status'] = 'pending'
+                    lost.append(spec)
+                except Exception:
+                    spec['error'] = traceback.format_exc()
+                    _failed(spec)
+                print(f"\t{spec['function']} run {spec['run']} {spec['log_dir']}: {spec['status']}")
+            write_manifest(manifest_path, manifest)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+    manifest['finished'] = datetime.now().isoformat()
+    write_manifest(manifest_path, manifest)
+    return manifest
+
+
+def _parse_override(text):
+    """
+    Parse a `section.option=value1;value2` command line override. Values are separated by `;`,
+    since list-valued options such as the bins contain commas
+    """
+    key, values = text.split('=', 1)
+    if '.' not in key:
+        raise argparse.ArgumentTypeError(f"Override {text} must be in the form section.option=value1;value2")
+    return key, values.split(';')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Campaign of MAP-Elites runs')
+    parser.add_argument('--conf', type=str, default='config.ini', help='Path to the base conf file')
+    parser.add_argument('--logdir', type=str, required=True, help='Root log directory of the campaign')
+    parser.add_argument('--funcs', type=str, nargs='+', default=CEC_FUNCTIONS,
+                        help='Optimization functions to use (default: C01 to C18)')
+    parser.add_argument('--runs', type=int, default=25, help='Number of runs of each function, with seeds 1 to runs')
+    parser.add_argument('--seeds', type=int, nargs='+', help='Explicit seeds of the runs, overrides --runs')
+    parser.add_argument('--set', type=_parse_override, action='append', default=[], dest='overrides',
+                        help='Config override section.option=value1;value2, e.g. "opt_function.bin_all=inf,0,1,inf;inf,0,inf" '
+                             '(the grid is the cartesian product)')
+    parser.add_argument('--workers', type=int, default=0, help='Number of worker processes, 0 to use all the cores')
+    parser.add_argument('--retries', type=int, default=1, help='Number of retries of a failed run')
+
+    args = parser.parse_args()
+
+    # seed 0 would be replaced by a random seed
+    seeds = args.seeds if args.seeds else list(range(1, args.runs + 1))
+    runs = make_grid(args.conf, args.logdir, args.funcs, seeds, dict(args.overrides))
+    manifest = run_campaign(runs, args.logdir, workers=args.workers, retries=args.retries)
+
+    failed = [r for r in manifest['runs'] if r['status'] == 'failed']
+    print(f"Campaign completed: {len(manifest['runs']) - len(failed)} runs done, {len(failed)} failed")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
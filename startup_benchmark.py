@@ -0,0 +1,84 @@
+import sys
+import argparse
+import subprocess
+
+import numpy as np
+
+
+# ====================================================================================================
+# Cold-start benchmark of the MAP-Elites entry points. Each repetition imports a module in a fresh
+# interpreter with `python -X importtime`, and the report lists the modules with the highest cumulative
+# import time (median over the repetitions). Fails if a module that must stay lazy is imported
+# (by default the plotting stack, which headless runs never need) or if the total exceeds a budget.
+# ====================================================================================================
+
+# imported only when plotting, see MapElites.plot_map_of_elites()
+LAZY_MODULES = ['matplotlib', 'pandas', 'seaborn']
+
+
+def import_times(module):
+    """
+    Import a module in a fresh interpreter
+    :param module: Name of the module
+    :return: dict module name -> (self, cumulative) import time in microseconds
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Import of {module} failed:\n{result.stderr}")
+    times = dict()
+    for line in result.stderr.splitlines():
+        # import time:    self [us] |  cumulative | imported package
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def benchmark(module, repeat=5):
+    """
+    Median import times of a module and of all the modules it imports
+    :param module: Name of the module
+    :param repeat: Number of fresh interpreters
+    :return: dict module name -> (self, cumulative) median import time in milliseconds
+    """
+    runs = [import_times(module) for _ in range(repeat)]
+    names = set().union(*runs)
+    return {n: tuple(np.median([r.get(n, (0, 0)) for r in runs], axis=0) / 1000) for n in names}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import time of the MAP-Elites modules')
+    parser.add_argument('modules', type=str, nargs='*', default=['mapelites_continuous_opt'],
+                        help='Modules to import')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of fresh interpreters per module')
+    parser.add_argument('--top', type=int, default=15, help='Number of modules to report')
+    parser.add_argument('--lazy', type=str, nargs='*', default=LAZY_MODULES,
+                        help='Top-level packages that must not be imported')
+    parser.add_argument('--budget', type=float, default=0, help='Maximum import time in ms, 0 to disable')
+
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        times = benchmark(module, repeat=args.repeat)
+        total = times[module][1]
+        print(f"{module}: {total:.1f} ms (median of {args.repeat})")
+        print(f"\t{'self [ms]':>10} {'cumul. [ms]':>12}  module")
+        for name, (own, cumulative) in sorted(times.items(), key=lambda t: -t[1][1])[:args.top]:
+            print(f"\t{own:10.1f} {cumulative:12.1f}  {name}")
+
+        eager = sorted({n.split('.')[0] for n in times} & set(args.lazy))
+        if eager:
+            print(f"\tFAIL: {', '.join(eager)} imported by {module}")
+            failed = True
+        if 0 < args.budget < total:
+            print(f"\tFAIL: {total:.1f} ms over the budget of {args.budget:.1f} ms")
+            failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
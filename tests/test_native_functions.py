@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+import functions
+import native_functions
+from map_elites.evaluators import ProcessPoolEvaluator
+
+FUNCTIONS = [f"C{n:02d}" for n in range(1, 19)]
+
+
+class _FunctionTask:
+    """
+    Evaluation task of a function alone, for the workers of a ProcessPoolEvaluator
+    """
+
+    def __init__(self, F):
+        self.F = F
+
+    def evaluate_solutions(self, X):
+        return self.F.evaluate_all_batch(X)
+
+
+def _random_solutions(F, n, seed=0):
+    domain = np.array(F.get_domain())
+    return np.random.default_rng(seed).uniform(domain[:, 0], domain[:, 1], (n, F.D))
+
+
+@pytest.mark.parametrize('dimensions', [10, 30])
+@pytest.mark.parametrize('name', FUNCTIONS)
+def test_python_parity(name, dimensions):
+    """
+    Every native function computes the same objective and constraint values as functions.py
+    """
+    F = getattr(native_functions, name)(dimensions)
+    P = getattr(functions, name)(dimensions)
+    X = _random_solutions(P, 256)
+    f, g, _ = F.evaluate_all_batch(X)
+    expected_f, expected_g, _ = P.evaluate_all_batch(X)
+    assert np.allclose(f, expected_f, rtol=1e-9, atol=1e-9)
+    assert np.allclose(g, expected_g, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize('name', ['C01', 'C06', 'C16'])
+def test_process_evaluator(name):
+    """
+    The workers of a process pool started with `spawn` unpickle the functions without importing
+    the library first, and compute the same values as the parent process
+    """
+    F = getattr(native_functions, name)(10)
+    X = np.random.default_rng(0).uniform(-10, 10, (64, 10))
+    evaluator = ProcessPoolEvaluator(workers=2, mp_context='spawn')
+    evaluator.start(_FunctionTask(F))
+    try:
+        results = [evaluator.submit(X[i:i + 16]).result() for i in range(0, len(X), 16)]
+    finally:
+        evaluator.close()
+    for expected, result in zip(F.evaluate_all_batch(X), zip(*results)):
+        assert np.array_equal(expected, np.concatenate(result))
+
+
+def test_rotated_dimensions():
+    with pytest.raises(ValueError):
+        native_functions.C06(12)
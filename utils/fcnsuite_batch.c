@@ -0,0 +1,34 @@
+/*
+  Batched entry point for the CEC 2010 test function suite in fcnsuite.c
+
+  Evaluates n contiguous row-major points of nx dimensions with one call:
+  x is a n * nx buffer, f is a n buffer, g is a n * ng buffer and h is a n * nh buffer.
+
+  for linux:
+
+  gcc -O2 -shared -fPIC -o fcnsuite.so fcnsuite_batch.c -lm
+*/
+
+#include "fcnsuite.c"
+
+typedef void (*cec_function) (double *, double *, double *, double *, int, int, int, int);
+
+static cec_function cec_functions[18] = {
+  C01, C02, C03, C04, C05, C06, C07, C08, C09,
+  C10, C11, C12, C13, C14, C15, C16, C17, C18
+};
+
+DLLIMPORT int
+CEC_batch (int fn, double *x, double *f, double *g, double *h, int n, int nx, int ng, int nh)
+{
+  int i;
+  if (fn < 1 || fn > 18)
+    {
+      return -1;
+    }
+  for (i = 0; i < n; i++)
+    {
+      cec_functions[fn - 1] (x + i * nx, f + i, g + i * ng, h + i * nh, nx, 1, ng, nh);
+    }
+  return 0;
+}